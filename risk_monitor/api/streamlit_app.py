@@ -11,6 +11,7 @@ import os
 import sys
 from datetime import datetime, timedelta
 import time
+from collections import Counter
 from typing import Dict, List, Any
 import logging
 import requests
@@ -35,19 +36,12 @@ def get_cached_analysis_results(articles_hash: str, sentiment_method: str):
     """Cache analysis results to improve performance"""
     return None  # Will be populated by actual analysis
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_cached_sentiment_distribution(articles: List[Dict]):
-    """Cache sentiment distribution calculation"""
-    positive_count = sum(1 for a in articles if a.get('sentiment_category') == 'Positive')
-    negative_count = sum(1 for a in articles if a.get('sentiment_category') == 'Negative')
-    neutral_count = len(articles) - positive_count - negative_count
-    
-    return {
-        'positive': positive_count,
-        'negative': negative_count,
-        'neutral': neutral_count,
-        'total': len(articles)
-    }
+# One collector for the whole server: its HTTP session, thread pool and caches
+# outlive reruns, and its sync methods all run on the collector's shared event loop
+@st.cache_resource(show_spinner=False)
+def get_news_collector() -> NewsCollector:
+    """Get the shared NewsCollector instance"""
+    return NewsCollector()
 
 # --- Custom CSS for a professional, elegant UI ---
 def load_custom_css():
@@ -1165,6 +1159,22 @@ def get_scheduler_status():
     except Exception as e:
         return False, [], {}
 
+def _tail(path: str, n: int = 10, block: int = 16384) -> List[str]:
+    """Return the last n lines of a file by reading only its final block."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.seek(max(0, size - block))
+        data = f.read().decode('utf-8', errors='replace')
+    lines = data.splitlines(keepends=True)
+    if size > block and lines:
+        lines = lines[1:]  # First line is likely partial
+    return lines[-n:]
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_cached_log_tail(path: str, mtime: float, size: int, n: int = 10) -> List[str]:
+    """Cache log tails; mtime and size are part of the key so changes are picked up."""
+    return _tail(path, n)
+
 # --- UI/UX Components ---
 def display_dashboard_header():
     """Displays the main dashboard header with title and subtitle."""
@@ -1175,8 +1185,10 @@ def display_dashboard_metrics():
     articles = st.session_state.get('articles', [])
     num_articles = len(articles)
     
-    positive_count = sum(1 for a in articles if a.get('sentiment_category') == 'Positive')
-    negative_count = sum(1 for a in articles if a.get('sentiment_category') == 'Negative')
+    # Counting a few hundred categories takes microseconds, less than any cache lookup would
+    sentiment_counts = Counter(a.get('sentiment_category') for a in articles)
+    positive_count = sentiment_counts['Positive']
+    negative_count = sentiment_counts['Negative']
     neutral_count = num_articles - positive_count - negative_count
     
     col1, col2, col3 = st.columns(3)
@@ -1537,7 +1549,7 @@ def main():
                     progress_container.empty()
                     return
 
-                news_collector = NewsCollector()
+                news_collector = get_news_collector()
                 analyzer = RiskAnalyzer()
                 collected_articles = []
                 total_steps = len(queries) * st.session_state.num_articles
@@ -1986,8 +1998,11 @@ def main():
                         
                         if sentiment_counts:
                             st.markdown("**📈 Sentiment Distribution:**")
-                            for sentiment, count in sentiment_counts.items():
-                                st.markdown(f"- {sentiment}: {count} articles")
+                            # Render all categories in a single element instead of one per line
+                            st.markdown("\n".join(
+                                f"- {sentiment}: {count} articles"
+                                for sentiment, count in sentiment_counts.items()
+                            ))
                         
                         st.markdown("---")
                         
@@ -2308,16 +2323,8 @@ def main():
                 ("ZS", "Zscaler Inc")
             ]
             
-            # Remove duplicates and sort
-            unique_companies = []
-            seen_symbols = set()
-            for symbol, name in nasdaq_100_companies:
-                if symbol not in seen_symbols:
-                    unique_companies.append((symbol, name))
-                    seen_symbols.add(symbol)
-            
-            # Sort by symbol
-            unique_companies.sort(key=lambda x: x[0])
+            # Remove duplicates (keyed by symbol) and sort by symbol
+            unique_companies = sorted(dict(nasdaq_100_companies).items())
             
             # Create dropdown for NASDAQ-100 companies
             col1, col2 = st.columns([3, 1])
@@ -2576,9 +2583,8 @@ def main():
             for log_file in log_files:
                 if os.path.exists(log_file):
                     try:
-                        with open(log_file, 'r') as f:
-                            lines = f.readlines()
-                            recent_lines = lines[-10:] if len(lines) > 10 else lines
+                        stat = os.stat(log_file)
+                        recent_lines = get_cached_log_tail(log_file, stat.st_mtime, stat.st_size)
                         
                         with st.expander(f"📄 {log_file} (last 10 lines)"):
                             st.code("".join(recent_lines), language="text")
@@ -2652,20 +2658,6 @@ def get_cached_analysis_results(articles_hash: str, sentiment_method: str):
     """Cache analysis results to improve performance"""
     return None  # Will be populated by actual analysis
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_cached_sentiment_distribution(articles: List[Dict]):
-    """Cache sentiment distribution calculation"""
-    positive_count = sum(1 for a in articles if a.get('sentiment_category') == 'Positive')
-    negative_count = sum(1 for a in articles if a.get('sentiment_category') == 'Negative')
-    neutral_count = len(articles) - positive_count - negative_count
-    
-    return {
-        'positive': positive_count,
-        'negative': negative_count,
-        'neutral': neutral_count,
-        'total': len(articles)
-    }
-
 # Entry point of the script
 if __name__ == "__main__":
     main()
@@ -5,7 +5,8 @@ Configuration settings for the Risk Monitor application.
 import os
 import re
 import datetime
-import pytz
+import functools
+import logging
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -22,6 +23,85 @@ load_dotenv()
 # Get the project root directory
 ROOT_DIR = Path(__file__).parent.parent.parent.absolute()
 
+# Separator for email recipient lists ("a@x.com, b@y.com; c@z.com")
+_EMAIL_SEP_RE = re.compile(r"[,;]")
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=64)
+def _tz(name: str):
+    """Memoized pytz.timezone lookup"""
+    import pytz
+    return pytz.timezone(name)
+
+
+# API keys found so far; a missing key isn't remembered, so one added later is still picked up
+_api_keys = {}
+
+
+def _get_api_key(name: str) -> Optional[str]:
+    """Get an API key, resolving it only until it has been found once"""
+    api_key = _api_keys.get(name)
+    if api_key is None:
+        api_key = _lookup_api_key(name)
+        if api_key:
+            _api_keys[name] = api_key
+    return api_key
+
+
+def _lookup_api_key(name: str) -> Optional[str]:
+    """Resolve an API key from environment, Streamlit secrets, or secrets.toml"""
+    # First try environment variable
+    env_key = os.getenv(name)
+    if env_key:
+        return env_key
+    
+    # Then try Streamlit secrets
+    try:
+        if st and hasattr(st, 'secrets') and name in st.secrets:
+            return st.secrets[name]
+    except Exception as e:
+        logger.debug(f"Failed to get {name} from Streamlit secrets: {e}")
+    
+    # Finally, try reading the secrets file directly
+    try:
+        secrets_file = os.path.join(ROOT_DIR, ".streamlit", "secrets.toml")
+        if os.path.exists(secrets_file):
+            import toml
+            with open(secrets_file, 'r') as f:
+                secrets = toml.load(f)
+            return secrets.get(name)
+    except Exception as e:
+        logger.debug(f"Failed to read secrets file directly: {e}")
+    
+    return None
+
+
+# Settings found so far; like API keys, a missing setting (and so its default) isn't remembered
+_settings = {}
+
+
+def _get_secret_or_env(name: str, default=None):
+    """Get a setting, resolving it only until it has been found once"""
+    value = _settings.get(name)
+    if value is None:
+        value = _lookup_secret_or_env(name)
+        if value is None:
+            return default
+        _settings[name] = value
+    return value
+
+
+def _lookup_secret_or_env(name: str):
+    """Resolve a setting from Streamlit secrets, falling back to the environment"""
+    try:
+        if st is not None and name in st.secrets:
+            return st.secrets[name]
+    except Exception:
+        pass
+    return os.getenv(name)
+
 
 class Config:
     """Configuration class for the risk monitoring tool"""
@@ -59,10 +139,34 @@ class Config:
     OUTPUT_DIR = os.path.join(ROOT_DIR, "output")
     LOG_DIR = os.path.join(ROOT_DIR, "logs")
     LOG_FILE = os.path.join(LOG_DIR, "risk_monitor.log")
+    EXTRACT_CACHE_DIR = os.path.join(OUTPUT_DIR, "cache", "extracts")
+    EXTRACT_CACHE_TTL_SEC = 86400  # Reuse extracted article content for 24 hours
     
     # Request Configuration
     REQUEST_TIMEOUT = 60  # Increased from 30 to 60 seconds for SerpAPI
     MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0  # seconds before the first retry; doubles on each attempt
+    RETRY_MAX_BACKOFF = 30  # upper bound on the backoff delay in seconds
+    RETRY_JITTER = 0.5  # add up to 50% random jitter to each delay
+    MAX_EXTRACT_CONCURRENCY = 8  # Max article extractions in flight at once
+    EXTRACT_TIMEOUT = 15  # Seconds allowed for downloading and parsing one article
+    PARSE_PROCESSES = 0  # Worker processes for HTML parsing in async collection (0 parses on the thread pool)
+    SEARCH_CACHE_TTL_SEC = 900  # Reuse SerpAPI results for the same query for 15 minutes
+    SERP_RPS = 5  # Max SerpAPI requests per second (0 disables limiting)
+    SERP_PAGE_SIZE = 10  # Results per SerpAPI page when an engine paginates (0 disables paging)
+    FETCH_RPS = 20  # Max article downloads per second (0 disables limiting)
+    PER_HOST_CONCURRENCY = 2  # Max simultaneous downloads from one news site
+    HOST_BACKOFF_MAX = 30  # Upper bound in seconds on the pause before hitting a throttling site again
+    
+    # Extraction Configuration
+    # Paywalled or JS-only sites that return no usable article text
+    EXTRACTION_DOMAIN_BLOCKLIST = frozenset({
+        'bloomberg.com', 'seekingalpha.com', 'wsj.com', 'ft.com',
+        'nytimes.com', 'washingtonpost.com', 'latimes.com', 'chicagotribune.com', 'thestreet.com', 'marketwatch.com'
+    })
+    DOMAIN_FAILURE_THRESHOLD = 3  # Skip a domain after this many consecutive failed extractions
+    DOMAIN_BLOCK_TTL_SEC = 3600  # How long a domain that kept failing is skipped before it is tried again
+    MAX_HTML_BYTES = 2_000_000  # Skip pages larger than this instead of downloading and parsing them (0 disables)
     
     # Scheduler Configuration
     DEFAULT_SCHEDULER_TIME = "08:00"  # 8:00 AM ET
@@ -73,6 +177,10 @@ class Config:
     PINECONE_INDEX_NAME = "sentiment-db"
     PINECONE_ENVIRONMENT = "us-east-1-aws"
     
+    # RAG Chat Configuration
+    RAG_CHAT_MODEL = "gpt-3.5-turbo"
+    RAG_CONTEXT_TOKENS = 10000  # Token budget for article text in the chat context (leaves room for prompts and the reply)
+    
     # Email defaults (can be overridden by env/secrets or scheduler_config)
     DEFAULT_EMAIL_FROM = "risk-monitor@localhost"
     DEFAULT_EMAIL_SUBJECT_PREFIX = "Risk Monitor"
@@ -80,166 +188,53 @@ class Config:
     @staticmethod
     def get_serpapi_key():
         """Get SerpAPI key from environment or Streamlit secrets"""
-        # First try environment variable
-        env_key = os.getenv("SERPAPI_KEY")
-        if env_key:
-            return env_key
-        
-        # Then try Streamlit secrets
-        try:
-            if st and hasattr(st, 'secrets'):
-                if hasattr(st.secrets, 'get'):
-                    return st.secrets.get("SERPAPI_KEY")
-                else:
-                    return st.secrets["SERPAPI_KEY"]
-        except Exception as e:
-            # Log the error for debugging
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to get SerpAPI key from Streamlit secrets: {e}")
-        
-        # Finally, try reading the secrets file directly
-        try:
-            secrets_file = os.path.join(ROOT_DIR, ".streamlit", "secrets.toml")
-            if os.path.exists(secrets_file):
-                import toml
-                with open(secrets_file, 'r') as f:
-                    secrets = toml.load(f)
-                return secrets.get("SERPAPI_KEY")
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to read secrets file directly: {e}")
-        
-        return None
+        return _get_api_key("SERPAPI_KEY")
     
     @staticmethod
     def get_openai_api_key():
         """Get OpenAI API key from environment or Streamlit secrets"""
-        # First try environment variable
-        env_key = os.getenv("OPENAI_API_KEY")
-        if env_key:
-            return env_key
-        
-        # Then try Streamlit secrets
-        try:
-            if st and hasattr(st, 'secrets'):
-                if hasattr(st.secrets, 'get'):
-                    return st.secrets.get("OPENAI_API_KEY")
-                else:
-                    return st.secrets["OPENAI_API_KEY"]
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to get OpenAI API key from Streamlit secrets: {e}")
-        
-        # Finally, try reading the secrets file directly
-        try:
-            secrets_file = os.path.join(ROOT_DIR, ".streamlit", "secrets.toml")
-            if os.path.exists(secrets_file):
-                import toml
-                with open(secrets_file, 'r') as f:
-                    secrets = toml.load(f)
-                return secrets.get("OPENAI_API_KEY")
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to read secrets file directly: {e}")
-        
-        return None
+        return _get_api_key("OPENAI_API_KEY")
     
     @staticmethod
     def get_pinecone_api_key():
         """Get Pinecone API key from environment or Streamlit secrets"""
-        # First try environment variable
-        env_key = os.getenv("PINECONE_API_KEY")
-        if env_key:
-            return env_key
-        
-        # Then try Streamlit secrets
-        try:
-            if st and hasattr(st, 'secrets'):
-                if hasattr(st.secrets, 'get'):
-                    return st.secrets.get("PINECONE_API_KEY")
-                else:
-                    return st.secrets["PINECONE_API_KEY"]
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to get Pinecone API key from Streamlit secrets: {e}")
-        
-        # Finally, try reading the secrets file directly
-        try:
-            secrets_file = os.path.join(ROOT_DIR, ".streamlit", "secrets.toml")
-            if os.path.exists(secrets_file):
-                import toml
-                with open(secrets_file, 'r') as f:
-                    secrets = toml.load(f)
-                return secrets.get("PINECONE_API_KEY")
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to read secrets file directly: {e}")
-        
-        return None
+        return _get_api_key("PINECONE_API_KEY")
 
     # Email/SMTP settings
     @staticmethod
     def get_smtp_host() -> str:
-        try:
-            return st.secrets["SMTP_HOST"]
-        except Exception:
-            return os.getenv("SMTP_HOST", "smtp.gmail.com")
+        return _get_secret_or_env("SMTP_HOST", "smtp.gmail.com")
 
     @staticmethod
     def get_smtp_port() -> int:
-        try:
-            return int(st.secrets["SMTP_PORT"])
-        except Exception:
-            return int(os.getenv("SMTP_PORT", "587"))
+        return int(_get_secret_or_env("SMTP_PORT", "587"))
 
     @staticmethod
     def get_smtp_user() -> Optional[str]:
-        try:
-            return st.secrets["SMTP_USER"]
-        except Exception:
-            return os.getenv("SMTP_USER")
+        return _get_secret_or_env("SMTP_USER")
 
     @staticmethod
     def get_smtp_password() -> Optional[str]:
-        try:
-            return st.secrets["SMTP_PASSWORD"]
-        except Exception:
-            return os.getenv("SMTP_PASSWORD")
+        return _get_secret_or_env("SMTP_PASSWORD")
 
     @staticmethod
     def get_email_from() -> str:
-        try:
-            return st.secrets["EMAIL_FROM"]
-        except Exception:
-            return os.getenv("EMAIL_FROM", Config.DEFAULT_EMAIL_FROM)
+        return _get_secret_or_env("EMAIL_FROM", Config.DEFAULT_EMAIL_FROM)
 
     @staticmethod
     def get_email_recipients() -> list[str]:
         # Comma or semicolon separated list
-        recipients = None
-        try:
-            recipients = st.secrets["EMAIL_RECIPIENTS"]
-        except Exception:
-            recipients = os.getenv("EMAIL_RECIPIENTS")
+        recipients = _get_secret_or_env("EMAIL_RECIPIENTS")
         if isinstance(recipients, list):
-            return recipients
+            return list(recipients)
         if isinstance(recipients, str) and recipients.strip():
-            parts = [p.strip() for p in re.split(r"[,;]", recipients) if p.strip()]  # type: ignore[name-defined]
+            parts = [p.strip() for p in _EMAIL_SEP_RE.split(recipients) if p.strip()]
             return parts
         return []
 
     @staticmethod
     def get_email_subject_prefix() -> str:
-        try:
-            return st.secrets["EMAIL_SUBJECT_PREFIX"]
-        except Exception:
-            return os.getenv("EMAIL_SUBJECT_PREFIX", Config.DEFAULT_EMAIL_SUBJECT_PREFIX)
+        return _get_secret_or_env("EMAIL_SUBJECT_PREFIX", Config.DEFAULT_EMAIL_SUBJECT_PREFIX)
 
     @classmethod
     def validate_config(cls):
@@ -258,8 +253,8 @@ class Config:
     def get_current_time_in_timezone(timezone_str="US/Eastern"):
         """Get current time in specified timezone"""
         try:
-            tz = pytz.timezone(timezone_str)
+            tz = _tz(timezone_str)
             return datetime.datetime.now(tz)
         except Exception:
             # Default to UTC if timezone is invalid
-            return datetime.datetime.now(pytz.UTC)
+            return datetime.datetime.now(datetime.timezone.utc)
@@ -4,24 +4,40 @@ Collects news articles using SerpAPI and extracts their content.
 Uses asynchronous requests for improved performance.
 """
 
-import requests
-import aiohttp
 import asyncio
+import atexit
 import time
 import logging
-import json
+import logging.handlers
 import os
+import queue
+import re
+import sys
+import tempfile
+import contextlib
+import copy
+import functools
+import random
+import hashlib
+import importlib.util
+import multiprocessing
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Union, Any
-from urllib.parse import urlparse
-import newspaper
-from newspaper import Article
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable, List, Dict, Optional, Tuple, Union, Any
+from urllib.parse import urlsplit, urlencode, parse_qsl
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import orjson
+import aiofiles
+from cachetools import TTLCache
 
 from risk_monitor.config.settings import Config
 
+# aiohttp, newspaper3k and trafilatura are imported where they are used so
+# that importing this module (e.g. on every Streamlit rerun) stays cheap
+if TYPE_CHECKING:
+    import aiohttp
+
 # Try to import streamlit to check if we're in a Streamlit context
 try:
     import streamlit as st
@@ -29,77 +45,469 @@ try:
 except ImportError:
     STREAMLIT_AVAILABLE = False
 
+# Optional token-bucket rate limiting for SerpAPI and article fetches
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
+
+# trafilatura does article extraction; newspaper3k (no longer a requirement) is only
+# used when trafilatura is missing and newspaper3k happens to be installed
+TRAFILATURA_AVAILABLE = importlib.util.find_spec("trafilatura") is not None
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+ARTICLE_FETCH_TIMEOUT = 10  # seconds per article download
+# aiohttp can only decode Brotli responses when a Brotli package is installed
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+# Rate limiting and transient server errors are worth retrying; other 4xx errors are not
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Response types worth handing to the article parser (PDFs, images etc. are skipped unread)
+HTML_CONTENT_TYPES = frozenset({'text/html', 'application/xhtml+xml'})
+# SerpAPI parameters shared by every news search; only q, num and api_key vary per request
+SERPAPI_NEWS_PARAMS = {'engine': 'google_news', 'tbm': 'nws'}
+
+# Query parameters that only track the click and never change the article
+TRACKING_PARAM_RE = re.compile(r'^(utm_\w+|gclid|fbclid|mc_cid|mc_eid|ocid|cmpid)$', re.IGNORECASE)
+
+# Event loop on a daemon thread that runs the sync wrappers' coroutines (started on first use)
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+# One aiohttp session per event loop, shared by every collector running on that loop
+_sessions: Dict[asyncio.AbstractEventLoop, 'aiohttp.ClientSession'] = {}
+_sessions_lock = threading.Lock()
+# Optional worker processes for CPU-bound HTML parsing (Config.PARSE_PROCESSES; started on first use)
+_parse_process_pool: Optional[ProcessPoolExecutor] = None
+_parse_process_pool_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop used by the sync wrappers, starting it if needed"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="news-loop", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+@atexit.register
+def _close_background_loop():
+    """Close the background loop's session and stop the loop"""
+    loop = _background_loop
+    if loop is None or not loop.is_running():
+        return
+    with _sessions_lock:
+        session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        try:
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+        except Exception:
+            pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+@functools.lru_cache(maxsize=1)
+def _newspaper_config():
+    """Build the newspaper3k settings shared by every Article (on first use)"""
+    from newspaper import Config as NewspaperConfig
+    config = NewspaperConfig()
+    config.browser_user_agent = BROWSER_USER_AGENT
+    config.request_timeout = ARTICLE_FETCH_TIMEOUT
+    config.number_threads = 1
+    config.verbose = False
+    # parse() would otherwise download candidate images to pick a top image we never use
+    config.fetch_images = False
+    config.memoize_articles = False
+    return config
+
+
+def _get_parse_process_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """Get the shared parse process pool, or None when parsing stays on threads"""
+    global _parse_process_pool
+    if not workers:
+        return None
+    with _parse_process_pool_lock:
+        if _parse_process_pool is None:
+            # spawn: forking a process that already runs the event loop and pool threads is unsafe
+            _parse_process_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parse_process_pool
+
+
+def _discard_parse_process_pool(pool: ProcessPoolExecutor):
+    """Drop a broken parse process pool so the next parse starts a fresh one"""
+    global _parse_process_pool
+    with _parse_process_pool_lock:
+        if _parse_process_pool is pool:
+            _parse_process_pool = None
+    pool.shutdown(wait=False)
+
+
+# The extractors below use no collector state, so they can also run in a parse worker process
+
+
+def _extract_with_trafilatura(url: str, html: Union[str, bytes]) -> Dict:
+    """Extract main text and metadata from downloaded HTML with trafilatura"""
+    import trafilatura
+    
+    # One pass parses the HTML once for both the text and the metadata
+    document = trafilatura.bare_extraction(
+        html, url=url, with_metadata=True,
+        include_comments=False, include_tables=False, favor_precision=False
+    )
+    if document is not None and not isinstance(document, dict):
+        # trafilatura 2.x returns a Document object, 1.x a plain dict
+        document = document.as_dict()
+    document = document or {}
+    
+    authors = [a.strip() for a in (document.get('author') or '').split(';') if a.strip()]
+    
+    return {
+        'url': url,
+        'title': document.get('title'),
+        'text': (document.get('text') or '').strip(),
+        'publish_date': document.get('date'),
+        'authors': authors,
+        'summary': '',  # newspaper3k only filled these via nlp(), which was never run
+        'keywords': [],
+        'meta_description': document.get('description'),
+        'extraction_time': time.time()
+    }
+
+
+def _extract_with_newspaper(url: str, html: Union[str, bytes]) -> Dict:
+    """Extract main text and metadata from downloaded HTML with newspaper3k"""
+    from newspaper import Article
+    
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    # Shallow copy: parsing sets the page's detected language on the article's config
+    article = Article(url, config=copy.copy(_newspaper_config()))
+    article.set_html(html)
+    article.parse()
+    
+    return {
+        'url': url,
+        'title': article.title,
+        'text': article.text.strip(),
+        'publish_date': article.publish_date.isoformat() if article.publish_date else None,
+        'authors': article.authors,
+        'summary': '',  # only filled by nlp(), which is never run
+        'keywords': [],
+        'meta_description': article.meta_description,
+        'extraction_time': time.time()
+    }
+
+
+def jsonl_to_json(jsonl_path: str, json_path: str = None) -> str:
+    """
+    Convert a JSON Lines article file into the JSON array save_articles writes
+
+    Lines are copied one at a time, so the file is never parsed or held in memory as a whole.
+
+    Args:
+        jsonl_path: Path of the .jsonl file
+        json_path: Output path (optional, defaults to jsonl_path with a .json extension)
+
+    Returns:
+        Path to the JSON file
+    """
+    if not json_path:
+        json_path = os.path.splitext(jsonl_path)[0] + ".json"
+
+    with open(jsonl_path, 'rb') as src, open(json_path, 'wb') as dst:
+        dst.write(b'[')
+        first = True
+        for line in src:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                dst.write(b',')
+            dst.write(line)
+            first = False
+        dst.write(b']')
+
+    return json_path
+
+
 class NewsCollector:
     """Collects news articles using SerpAPI and extracts their content"""
     
+    # Output, log and cache directories are created once per process
+    _dirs_ready = False
+    
+    # Result caches are shared by every collector in the process, so a collector
+    # created on each Streamlit rerun still hits results fetched by earlier ones
+    # Extracted content keyed by URL hash, backed by JSON files on disk
+    _extract_cache = TTLCache(maxsize=2048, ttl=Config.EXTRACT_CACHE_TTL_SEC, timer=time.time)
+    _extract_cache_lock = threading.Lock()
+    # SerpAPI results keyed by (query, num_results)
+    _search_cache = TTLCache(maxsize=256, ttl=Config.SEARCH_CACHE_TTL_SEC, timer=time.time)
+    _search_cache_lock = threading.Lock()
+    
     def __init__(self):
         self.config = Config()
+        self._ensure_dirs()
         self.setup_logging()
-        # Performance optimization: Use a session for HTTP requests
-        self.session = httpx.Client(timeout=10.0)
-        # Blocked domains that frequently return 403
-        self.blocked_domains = {
-            'bloomberg.com', 'seekingalpha.com', 'wsj.com', 'ft.com',
-            'nytimes.com', 'washingtonpost.com', 'latimes.com', 'chicagotribune.com', 'thestreet.com', 'marketwatch.com'
-        }
+        # Shared, bounded pool for blocking extraction work (downloads and HTML parsing)
+        self._extractor_pool = ThreadPoolExecutor(
+            max_workers=min(16, 4 * (os.cpu_count() or 1)),
+            thread_name_prefix="news-io"
+        )
+        # Caps concurrent extractions (created lazily on the running loop)
+        self._extract_sem: Optional[asyncio.Semaphore] = None
+        self._extract_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Request-rate limiters by name (created lazily on the running loop)
+        self._limiters: Dict[str, Any] = {}
+        self._limiters_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Per-site download slots (created lazily on the running loop) and the
+        # pause before the next request to sites that answered 429/503
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_sems_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_delay: Dict[str, float] = {}
+        # In-flight searches/extractions as [task, waiter count], so concurrent callers share one request
+        self._inflight_search: Dict[tuple, List] = {}
+        self._inflight_extract: Dict[str, List] = {}
+        # Domains that paywall or block scraping
+        self.blocked_domains = self.config.EXTRACTION_DOMAIN_BLOCKLIST
+        # Domains that kept failing, skipped only for a while: this collector is shared by every
+        # Streamlit session and the scheduler, and a site's failures are often temporary
+        self._failing_domains = TTLCache(maxsize=1024, ttl=self.config.DOMAIN_BLOCK_TTL_SEC, timer=time.time)
+        # Consecutive failed extractions per domain
+        self._domain_failures: Dict[str, int] = {}
+        self._domain_lock = threading.Lock()
     
+    def _ensure_dirs(self):
+        """Create the output, log and extraction cache directories if needed"""
+        if NewsCollector._dirs_ready:
+            return
+        for directory in (self.config.OUTPUT_DIR, os.path.dirname(self.config.LOG_FILE), self.config.EXTRACT_CACHE_DIR):
+            os.makedirs(directory, exist_ok=True)
+        NewsCollector._dirs_ready = True
+
     def setup_logging(self):
         """Setup logging configuration"""
-        # Create logs directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.config.LOG_FILE), exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.config.LOG_FILE),
-                logging.StreamHandler()
-            ]
-        )
+        # basicConfig ignores handlers once the root logger is configured,
+        # so only open the log file when they will actually be installed
+        if not logging.getLogger().handlers:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            # Batch file writes; errors (and interpreter shutdown) flush immediately
+            file_handler = logging.FileHandler(self.config.LOG_FILE)
+            file_handler.setFormatter(formatter)
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=256,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            # Logging calls only enqueue the record; a listener thread does the file and
+            # console writes, so the event loop never waits on log I/O
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, buffered_handler, console_handler)
+            listener.start()
+            # Runs before logging's own shutdown hook, which then flushes the file buffer
+            atexit.register(listener.stop)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            # The listener's handlers apply the full format; only merge the message args here
+            queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         self.logger = logging.getLogger(__name__)
 
-    def _is_blocked_domain(self, url: str) -> bool:
-        """Check if URL is from a blocked domain"""
-        try:
-            domain = urlparse(url).netloc.lower()
-            return any(blocked in domain for blocked in self.blocked_domains)
-        except:
-            return False
-    
-    def _run_without_streamlit_context(self, func, *args, **kwargs):
-        """Run a function without Streamlit context to avoid ScriptRunContext errors"""
-        if STREAMLIT_AVAILABLE:
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Get the aiohttp session for the running loop, creating it on first use
+
+        A session is bound to the event loop it was created on, so each loop gets
+        its own, shared by all collectors on that loop. Entries for loops that were
+        closed without aclose() are dropped here.
+        """
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        with _sessions_lock:
+            session = _sessions.get(loop)
+            if session is not None and not session.closed:
+                return session
+            
+            for stale_loop in [other for other in _sessions if other.is_closed()]:
+                del _sessions[stale_loop]
+            
             try:
-                # Clear any existing Streamlit context
-                import streamlit.runtime.scriptrunner as sr
-                if hasattr(sr, 'get_script_run_ctx'):
-                    ctx = sr.get_script_run_ctx()
-                    if ctx is not None:
-                        # We're in a Streamlit context, run in isolation
-                        import threading
-                        result = [None]
-                        exception = [None]
-                        
-                        def run_in_thread():
-                            try:
-                                result[0] = func(*args, **kwargs)
-                            except Exception as e:
-                                exception[0] = e
-                        
-                        thread = threading.Thread(target=run_in_thread)
-                        thread.start()
-                        thread.join()
-                        
-                        if exception[0]:
-                            raise exception[0]
-                        return result[0]
-            except Exception:
-                # If context isolation fails, run normally
-                pass
-        
-        # Run normally if not in Streamlit context or isolation failed
-        return func(*args, **kwargs)
+                # c-ares lookups on the loop instead of a getaddrinfo call per lookup in the default executor
+                resolver = aiohttp.AsyncResolver()
+            except Exception as e:
+                # aiodns isn't installed, or can't run on this loop (pycares needs a selector loop on Windows)
+                self.logger.debug(f"Using threaded DNS resolver: {e}")
+                resolver = aiohttp.ThreadedResolver()
+            
+            # limit_per_host keeps one news site from taking every pooled connection;
+            # news CDNs are hit repeatedly, so DNS answers and idle connections are kept longer
+            connector = aiohttp.TCPConnector(
+                resolver=resolver,
+                limit=64,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                force_close=False,
+                # Aborted TLS connections leak without this on Python < 3.12.7 (fixed in asyncio since)
+                enable_cleanup_closed=sys.version_info < (3, 12, 7)
+            )
+            session = _sessions[loop] = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.REQUEST_TIMEOUT),
+                headers={'User-Agent': BROWSER_USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+            )
+            return session
+
+    def _max_extract_concurrency(self) -> int:
+        """Configured extraction limit; an unset or zero value would stall every extraction"""
+        return max(1, self.config.MAX_EXTRACT_CONCURRENCY or 8)
+
+    def _get_extract_semaphore(self) -> asyncio.Semaphore:
+        """Get the extraction semaphore for the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._extract_sem is None or self._extract_sem_loop is not loop:
+            self._extract_sem = asyncio.Semaphore(self._max_extract_concurrency())
+            self._extract_sem_loop = loop
+        return self._extract_sem
 
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get the download semaphore for a site on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._host_sems_loop is not loop:
+            self._host_sems = {}
+            self._host_sems_loop = loop
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(max(1, self.config.PER_HOST_CONCURRENCY or 2))
+        return sem
+
+    def _update_host_delay(self, host: str, throttled: bool):
+        """Double a site's pause when it throttles us and shrink it by a second on each success"""
+        delay = self._host_delay.get(host, 0.0)
+        if throttled:
+            self._host_delay[host] = min(max(1.0, delay * 2), self.config.HOST_BACKOFF_MAX)
+        elif delay > 1.0:
+            self._host_delay[host] = delay - 1.0
+        elif delay:
+            del self._host_delay[host]
+
+    def _rate_limit(self, name: str, rate: float):
+        """
+        Get an async context manager that waits for a request slot under the given rate
+        
+        Args:
+            name: Limiter name, e.g. 'serp' or 'fetch'
+            rate: Requests per second; a falsy rate disables limiting
+        
+        Returns:
+            An AsyncLimiter for the running loop, or a no-op context if aiolimiter is missing
+        """
+        if not AIOLIMITER_AVAILABLE or not rate:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        if self._limiters_loop is not loop:
+            self._limiters = {}
+            self._limiters_loop = loop
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = self._limiters[name] = AsyncLimiter(rate, 1)
+        return limiter
+
+    async def _single_flight(self, inflight: Dict, key, start):
+        """
+        Await the in-flight task for key, starting it with start() if there is none
+
+        A cancelled caller only stops waiting, so the others still get the result;
+        once the last caller has gone the task itself is cancelled, so abandoned
+        work doesn't keep running. Entries from a previous event loop are replaced.
+        There is no await between the lookup and the insert, so callers on the same
+        loop cannot race.
+        """
+        entry = inflight.get(key)
+        if entry is None or entry[0].get_loop() is not asyncio.get_running_loop():
+            entry = [asyncio.ensure_future(start()), 0]
+            inflight[key] = entry
+            entry[0].add_done_callback(lambda _: inflight.pop(key, None) if inflight.get(key) is entry else None)
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if not entry[1] and not task.done():
+                task.cancel()
+                # Let it unwind before returning, so no work outlives its last caller
+                await asyncio.wait([task])
+
+    async def aclose(self):
+        """Close the aiohttp session of the running loop; call before closing a loop you created"""
+        with _sessions_lock:
+            session = _sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close(self):
+        """Release the extraction thread pool; the collector cannot extract afterwards"""
+        self._extractor_pool.shutdown(wait=False)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_domain(url: str) -> str:
+        """Get the lowercase host of a URL without a leading 'www.' (memoized, URLs are checked repeatedly)"""
+        try:
+            host = (urlsplit(url).hostname or '').lower()
+        except ValueError:
+            return ''
+        return host[4:] if host.startswith('www.') else host
+    
+    @staticmethod
+    def _canonical_url(url: str) -> str:
+        """Normalize a URL for duplicate detection (host case, tracking params, fragment, trailing slash)"""
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                           if not TRACKING_PARAM_RE.match(k)])
+        path = parts.path.rstrip('/') or '/'
+        return parts._replace(netloc=parts.netloc.lower(), path=path, query=query, fragment='').geturl()
+    
+    def _is_blocked_domain(self, url: str) -> bool:
+        """Check if URL is from a blocked domain or one of its subdomains"""
+        # Look up the host and each parent domain, so the cost doesn't grow with the blocklist
+        labels = self._get_domain(url).split('.')
+        domains = ['.'.join(labels[i:]) for i in range(len(labels))]
+        if any(domain in self.blocked_domains for domain in domains):
+            return True
+        with self._domain_lock:
+            return any(domain in self._failing_domains for domain in domains)
+    
+    def _record_extraction_result(self, url: str, success: bool):
+        """Track consecutive failures per domain and block domains that keep failing"""
+        domain = self._get_domain(url)
+        if not domain:
+            return
+        with self._domain_lock:
+            if success:
+                self._domain_failures.pop(domain, None)
+                return
+            failures = self._domain_failures.get(domain, 0) + 1
+            if failures < self.config.DOMAIN_FAILURE_THRESHOLD:
+                self._domain_failures[domain] = failures
+                return
+            # Start counting afresh once the block expires
+            self._domain_failures.pop(domain, None)
+            self._failing_domains[domain] = True
+        self.logger.warning(f"🚫 Skipping {domain} for {self.config.DOMAIN_BLOCK_TTL_SEC}s after {failures} consecutive failed extractions")
+    
     async def search_news_async(self, query: str = None, num_results: int = None) -> List[Dict]:
         """
         Asynchronously search for news articles using SerpAPI
@@ -114,6 +522,28 @@ class NewsCollector:
         query = query or self.config.SEARCH_QUERY
         num_results = num_results or self.config.NUM_ARTICLES
         
+        cached = self._get_cached_search(query, num_results)
+        if cached is not None:
+            return cached
+        
+        # Concurrent identical searches share one request
+        articles = await self._single_flight(
+            self._inflight_search, (query, num_results),
+            lambda: self._search_news_uncached(query, num_results)
+        )
+        return list(articles)
+
+    def _get_cached_search(self, query: str, num_results: int) -> Optional[List[Dict]]:
+        """Return a copy of the cached results for this search, or None on a miss"""
+        with self._search_cache_lock:
+            cached = self._search_cache.get((query, num_results))
+        if cached is None:
+            return None
+        self.logger.info(f"Using cached search results for query: {query} ({len(cached)} articles)")
+        return list(cached)
+
+    async def _search_news_uncached(self, query: str, num_results: int) -> List[Dict]:
+        """Run a SerpAPI search and cache non-empty results"""
         self.logger.info(f"Searching for news with query: {query}, requesting {num_results} results")
         
         # Check if API key is available
@@ -128,52 +558,77 @@ class NewsCollector:
                 self.logger.error(f"Configuration validation failed: {e}")
             return []
         
-        self.logger.info(f"✅ SerpAPI key found (length: {len(api_key)}), making request...")
+        params = {**SERPAPI_NEWS_PARAMS, 'q': query, 'api_key': api_key, 'num': num_results}
         
-        params = {
-            'q': query,
-            'api_key': api_key,
-            'engine': 'google_news',
-            'num': num_results,
-            'tbm': 'nws'  # News search
-        }
+        self.logger.debug("🔧 SerpAPI request to %s with params %s", self.config.SERPAPI_BASE_URL,
+                          dict(params, api_key='***HIDDEN***'))
         
-        self.logger.info(f"🔧 Request URL: {self.config.SERPAPI_BASE_URL}")
-        self.logger.info(f"🔧 Request params: {dict(params, api_key='***HIDDEN***')}")
+        articles = await self._search_serpapi_paged(params, num_results)
+        if articles:
+            with self._search_cache_lock:
+                self._search_cache[(query, num_results)] = articles
+        return articles
+
+    async def _search_serpapi_paged(self, params: dict, num_results: int) -> List[Dict]:
+        """
+        Fetch search results a page at a time, requesting the remaining pages concurrently
         
-        # Use synchronous requests instead of aiohttp for better compatibility
-        return self._search_news_sync(params)
-    
-    def _search_news_sync(self, params: dict) -> List[Dict]:
-        """Fast synchronous implementation with optimized parameters"""
-        import requests
+        The first page shows whether the engine paginates: google_news ignores num/start
+        and returns everything at once, in which case no further pages are requested.
+        """
+        page_size = self.config.SERP_PAGE_SIZE
+        if not page_size or num_results <= page_size:
+            return await self._search_serpapi_async(params)
         
-        # Fast retry logic - reduced attempts and timeout
-        max_retries = 2  # Reduced from 3
-        timeout = 30     # Reduced from 60 seconds
+        articles = await self._search_serpapi_async({**params, 'num': page_size})
+        if len(articles) != page_size:
+            # Either the engine returned all results in one response or there are no more
+            return articles
+        
+        pages = [
+            {**params, 'start': start, 'num': min(page_size, num_results - start)}
+            for start in range(page_size, num_results, page_size)
+        ]
+        self.logger.info(f"📄 Fetching {len(pages)} more result pages concurrently")
+        # Each page request goes through the SerpAPI rate limiter
+        page_results = await asyncio.gather(*(self._search_serpapi_async(page) for page in pages))
+        
+        seen = {article.get('link') for article in articles}
+        for page in page_results:
+            for article in page:
+                link = article.get('link')
+                if link not in seen:
+                    seen.add(link)
+                    articles.append(article)
+        return articles
+
+    async def _search_serpapi_async(self, params: dict) -> List[Dict]:
+        """Query SerpAPI through the shared aiohttp session with retry and fallback"""
+        import aiohttp
+        
+        max_retries = max(1, self.config.MAX_RETRIES)
+        # Fail fast on connect, allow slow SerpAPI responses
+        timeout = aiohttp.ClientTimeout(total=30, sock_connect=3, sock_read=20)
+        session = await self._get_session()
+        
+        # Add optimized parameters for faster response
+        optimized_params = {
+            **params,
+            'safe': 'active',
+            'gl': 'us',
+            'hl': 'en',
+            'filter': '0'
+        }
         
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"Attempt {attempt + 1}/{max_retries} - Making SerpAPI request...")
                 
-                # Add optimized parameters for faster response
-                optimized_params = {
-                    **params,
-                    'safe': 'active',     # Safe search might be faster
-                    'gl': 'us',           # Specific country
-                    'hl': 'en',           # Specific language
-                    'filter': '0'         # No filtering
-                }
-                
-                response = requests.get(
-                    self.config.SERPAPI_BASE_URL,
-                    params=optimized_params,
-                    timeout=timeout
-                )
-                
-                self.logger.info(f"✅ SerpAPI response status: {response.status_code}")
-                response.raise_for_status()
-                data = response.json()
+                async with self._rate_limit('serp', self.config.SERP_RPS):
+                    async with session.get(self.config.SERPAPI_BASE_URL, params=optimized_params, timeout=timeout) as response:
+                        self.logger.info(f"✅ SerpAPI response status: {response.status}")
+                        response.raise_for_status()
+                        data = orjson.loads(await response.read())
                 
                 if 'news_results' in data:
                     articles = data['news_results']
@@ -183,39 +638,52 @@ class NewsCollector:
                     self.logger.warning("No news results found in API response")
                     return []
                     
-            except requests.exceptions.Timeout as e:
+            except asyncio.TimeoutError as e:
                 self.logger.warning(f"Timeout on attempt {attempt + 1}/{max_retries}: {e}")
-                if attempt < max_retries - 1:
-                    self.logger.info(f"Retrying in 1 second...")
-                    import time
-                    time.sleep(1)  # Faster retry
-                else:
+                if attempt == max_retries - 1:
                     self.logger.error("SerpAPI timeout - trying fallback")
-                    return self._search_news_fallback(params)
-            except requests.exceptions.RequestException as e:
+                    return await self._search_serpapi_fallback_async(params)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUS_CODES:
+                    # Auth/quota/bad-request errors won't succeed on retry
+                    self.logger.error(f"❌ SerpAPI request failed with status {e.status}: {e.message}")
+                    return []
+                self.logger.warning(f"SerpAPI returned {e.status} on attempt {attempt + 1}/{max_retries}")
+                if attempt == max_retries - 1:
+                    return await self._search_serpapi_fallback_async(params)
+            except aiohttp.ClientError as e:
                 self.logger.error(f"Request error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                else:
-                    return self._search_news_fallback(params)
+                if attempt == max_retries - 1:
+                    return await self._search_serpapi_fallback_async(params)
             except Exception as e:
                 self.logger.error(f"Unexpected error on attempt {attempt + 1}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                else:
+                if attempt == max_retries - 1:
                     return []
+            
+            delay = self._backoff_delay(attempt)
+            self.logger.info(f"Retrying in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+        return []
     
-    def _search_news_fallback(self, params: dict) -> List[Dict]:
-        """Fallback method with basic parameters only"""
-        import requests
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter, so concurrent retries don't hit SerpAPI in lockstep"""
+        delay = min(self.config.RETRY_MAX_BACKOFF, self.config.RETRY_BASE_DELAY * (2 ** attempt))
+        return delay * (1 + random.uniform(0, self.config.RETRY_JITTER))
+
+    async def _search_serpapi_fallback_async(self, params: dict) -> List[Dict]:
+        """Fallback SerpAPI request with basic parameters only"""
+        import aiohttp
+        
         try:
             self.logger.info("🔄 Trying fallback with basic parameters...")
-            response = requests.get(
-                self.config.SERPAPI_BASE_URL,
-                params=params,  # Original parameters only
-                timeout=45  # Slightly longer timeout for fallback
-            )
-            data = response.json()
+            session = await self._get_session()
+            async with self._rate_limit('serp', self.config.SERP_RPS):
+                async with session.get(
+                    self.config.SERPAPI_BASE_URL,
+                    params=params,  # Original parameters only
+                    timeout=aiohttp.ClientTimeout(total=45, sock_connect=3, sock_read=30)
+                ) as response:
+                    data = orjson.loads(await response.read())
             if 'news_results' in data:
                 articles = data['news_results']
                 self.logger.info(f"Fallback successful: {len(articles)} articles")
@@ -223,7 +691,7 @@ class NewsCollector:
         except Exception as e:
             self.logger.error(f"Fallback also failed: {e}")
         return []
-            
+    
     def search_news(self, query: str = None, num_results: int = None) -> List[Dict]:
         """
         Synchronous wrapper for search_news_async
@@ -235,51 +703,43 @@ class NewsCollector:
         Returns:
             List of article metadata dictionaries
         """
-        # Add debugging information
-        self.logger.info(f"🔍 search_news called - checking event loop status...")
+        # Answer repeated searches (e.g. Streamlit reruns) without a hop to the background loop
+        cached = self._get_cached_search(query or self.config.SEARCH_QUERY, num_results or self.config.NUM_ARTICLES)
+        if cached is not None:
+            return cached
+        try:
+            return self._run_sync(lambda: self.search_news_async(query, num_results), timeout=120)
+        except FuturesTimeoutError:
+            self.logger.error("🔍 Search timed out after 120 seconds")
+            return []
+    
+    def _run_sync(self, make_coro, timeout: Optional[float] = None):
+        """
+        Run a collector coroutine to completion from synchronous code
         
-        # Check if there's already an event loop running
+        The coroutine runs on the process-wide background loop, so the aiohttp
+        session, its connection pool and DNS cache are reused across calls.
+        Works the same whether or not the caller's thread has a running loop.
+        """
+        loop = _get_background_loop()
         try:
-            loop = asyncio.get_running_loop()
-            self.logger.info(f"🔍 Event loop already running: {loop}")
-            # If we're in an async context, we need to run this differently
-            import concurrent.futures
-            self.logger.info(f"🔍 Using ThreadPoolExecutor for async execution...")
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(self._run_search_sync, query, num_results)
-                try:
-                    result = future.result(timeout=120)  # 2 minute timeout
-                    self.logger.info(f"🔍 ThreadPoolExecutor completed successfully")
-                    return result
-                except concurrent.futures.TimeoutError:
-                    self.logger.error(f"🔍 ThreadPoolExecutor timed out after 120 seconds")
-                    return []
+            running = asyncio.get_running_loop()
         except RuntimeError:
-            self.logger.info(f"🔍 No event loop running, creating new one...")
-            # No event loop running, we can create one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(self.search_news_async(query, num_results))
-                self.logger.info(f"🔍 New event loop completed successfully")
-                return result
-            finally:
-                loop.close()
-                self.logger.info(f"🔍 Event loop closed")
-    
-    def _run_search_sync(self, query: str = None, num_results: int = None) -> List[Dict]:
-        """Helper method to run search in a separate thread"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+            running = None
+        if running is loop:
+            # Blocking here would stall the loop the coroutine needs
+            raise RuntimeError("Sync collector methods cannot be called from the collector's event loop; await the async methods instead")
+        
+        future = asyncio.run_coroutine_threadsafe(make_coro(), loop)
         try:
-            return loop.run_until_complete(self.search_news_async(query, num_results))
-        finally:
-            loop.close()
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
     
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=4, max=10))
     def extract_article_content(self, url: str) -> Optional[Dict]:
         """
-        Extract content from a news article URL with retry logic and timeout
+        Extract content from a news article URL, reusing cached extractions
         
         Args:
             url: URL of the article to extract
@@ -287,55 +747,116 @@ class NewsCollector:
         Returns:
             Dictionary containing extracted article data or None if failed
         """
+        key = self._extract_cache_key(url)
+        cached = self._get_cached_extract(key, url)
+        if cached is not None:
+            return cached
+        
+        result = self._extract_article_content_uncached(url)
+        if result:
+            self._store_cached_extract(key, result)
+            return dict(result)
+        return result
+    
+    @classmethod
+    def _extract_cache_key(cls, url: str) -> str:
+        """Cache key for a URL; tracking parameters and host case don't change the article"""
+        return hashlib.sha256(cls._canonical_url(url).encode('utf-8')).hexdigest()
+    
+    def _get_cached_extract(self, key: str, url: str) -> Optional[Dict]:
+        """Look up an extraction in the memory cache, then on disk"""
+        with self._extract_cache_lock:
+            cached = self._extract_cache.get(key)
+        if cached is None:
+            cached = self._read_cached_extract(key)
+            if cached is not None:
+                with self._extract_cache_lock:
+                    self._extract_cache[key] = cached
+        if cached is not None:
+            self.logger.debug("Using cached content for: %s", url)
+            # The entry may come from a variant of this URL (e.g. other tracking parameters)
+            return {**cached, 'url': url}
+        return None
+    
+    def _store_cached_extract(self, key: str, article: Dict):
+        """Add an extraction to the memory and disk caches"""
+        self._write_cached_extract(key, article)
+        with self._extract_cache_lock:
+            self._extract_cache[key] = article
+    
+    def _read_cached_extract(self, key: str) -> Optional[Dict]:
+        """Load a cached extraction from disk if it is still fresh"""
+        path = os.path.join(self.config.EXTRACT_CACHE_DIR, f"{key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) > self.config.EXTRACT_CACHE_TTL_SEC:
+                return None
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cached_extract(self, key: str, article: Dict):
+        """Persist an extraction to the disk cache"""
+        path = os.path.join(self.config.EXTRACT_CACHE_DIR, f"{key}.json")
+        data = orjson.dumps(article, default=str, option=orjson.OPT_NON_STR_KEYS)
+        tmp_path = None
+        try:
+            # Write a private temp file and rename it into place, so a crash or a concurrent
+            # writer never leaves a truncated entry that later reads would accept
+            with tempfile.NamedTemporaryFile(dir=self.config.EXTRACT_CACHE_DIR, prefix=f"{key}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write extraction cache for {article.get('url')}: {e}")
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+    
+    def _extract_article_content_uncached(self, url: str) -> Optional[Dict]:
+        """Extract content from a news article URL (downloads retry transient errors once)"""
         try:
             # Skip blocked domains to avoid wasting time
             if self._is_blocked_domain(url):
-                self.logger.info(f"Skipping blocked domain: {url}")
+                self.logger.debug("Skipping blocked domain: %s", url)
                 return None
             
-            self.logger.info(f"Extracting content from: {url}")
-            
-            # Use newspaper3k with timeout and custom configuration
-            article = Article(url)
-            article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            article.config.request_timeout = 10
-            article.config.number_threads = 1
-            article.config.verbose = False
+            self.logger.debug("Extracting content from: %s", url)
             
-            # Set timeout for download
-            article.download()
-            article.parse()
-            
-            # Extract text content
-            text = article.text.strip()
-            
-            if not text or len(text) < 50:  # Minimum content threshold
-                self.logger.warning(f"Insufficient text content extracted from {url}")
-                return None
-            
-            return {
-                'url': url,
-                'title': article.title,
-                'text': text,
-                'publish_date': article.publish_date.isoformat() if article.publish_date else None,
-                'authors': article.authors,
-                'summary': article.summary,
-                'keywords': article.keywords,
-                'meta_description': article.meta_description,
-                'extraction_time': time.time()
-            }
+            # Download through the shared aiohttp session so sync callers reuse its pooled connections
+            html = self._run_sync(lambda: self._fetch_html(url), timeout=ARTICLE_FETCH_TIMEOUT + 5)
+            if TRAFILATURA_AVAILABLE:
+                return self._parse_article_html(url, html)
+            return self._parse_html_with_newspaper(url, html)
             
         except Exception as e:
             self.logger.error(f"Error extracting content from {url}: {e}")
             return None
 
+    def _checked_extraction(self, url: str, article: Dict) -> Optional[Dict]:
+        """Return an extracted article, or None if too little text was found"""
+        text = article.get('text')
+        if not text or len(text) < 50:  # Minimum content threshold
+            self.logger.warning(f"Insufficient text content extracted from {url}")
+            return None
+        return article
+
+    def _parse_html_with_newspaper(self, url: str, html: Union[str, bytes]) -> Optional[Dict]:
+        """Extract main text and metadata from downloaded HTML with newspaper3k"""
+        return self._checked_extraction(url, _extract_with_newspaper(url, html))
+
+    def _parse_article_html(self, url: str, html: Union[str, bytes]) -> Optional[Dict]:
+        """Extract main text and metadata from downloaded HTML with trafilatura"""
+        return self._checked_extraction(url, _extract_with_trafilatura(url, html))
+
     def extract_articles_concurrent(self, urls: List[str], max_workers: int = 5) -> List[Dict]:
         """
-        Extract articles concurrently using ThreadPoolExecutor for better performance
+        Extract articles concurrently on the collector's event loop for better performance
         
         Args:
             urls: List of URLs to extract
-            max_workers: Maximum number of concurrent workers
+            max_workers: Max articles extracted at once (also bounded by the collector's shared pool)
             
         Returns:
             List of extracted articles
@@ -345,77 +866,58 @@ class NewsCollector:
             self.logger.info("Using sequential processing to avoid Streamlit context issues")
             return self._extract_articles_sequential(urls)
         
-        # Use context isolation to avoid Streamlit ScriptRunContext errors
+        # Pool workers never call Streamlit, so they need no ScriptRunContext of their own
         try:
-            return self._run_without_streamlit_context(self._extract_articles_concurrent_isolated, urls, max_workers)
+            return self._extract_articles_concurrent_isolated(urls, max_workers)
         except Exception as e:
             self.logger.warning(f"Concurrent extraction failed, falling back to sequential: {e}")
             return self._extract_articles_sequential(urls)
     
     def _extract_articles_concurrent_isolated(self, urls: List[str], max_workers: int = 5) -> List[Dict]:
         """Internal method that runs without Streamlit context"""
-        extracted_articles = []
+        try:
+            extracted_articles = self._run_sync(lambda: self._extract_many(urls, max_workers, timeout=30), timeout=35)
+        except FuturesTimeoutError:
+            self.logger.warning("Batch extraction timed out")
+            extracted_articles = []
         
-        # Create a standalone extraction function to avoid Streamlit context issues
-        def extract_single_article(url: str) -> Optional[Dict]:
-            """Extract a single article without Streamlit context dependencies"""
-            try:
-                # Skip blocked domains to avoid wasting time
-                if self._is_blocked_domain(url):
-                    self.logger.info(f"Skipping blocked domain: {url}")
-                    return None
-                
-                self.logger.info(f"Extracting content from: {url}")
-                
-                # Use newspaper3k with timeout and custom configuration
-                article = Article(url)
-                article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                article.config.request_timeout = 10
-                article.config.number_threads = 1
-                article.config.verbose = False
-                
-                # Set timeout for download
-                article.download()
-                article.parse()
-                
-                # Extract text content
-                text = article.text.strip()
-                
-                if not text or len(text) < 50:  # Minimum content threshold
-                    self.logger.warning(f"Insufficient text content extracted from {url}")
-                    return None
-                
-                return {
-                    'url': url,
-                    'title': article.title,
-                    'text': text,
-                    'publish_date': article.publish_date.isoformat() if article.publish_date else None,
-                    'authors': article.authors,
-                    'summary': article.summary,
-                    'keywords': article.keywords,
-                    'meta_description': article.meta_description,
-                    'extraction_time': time.time()
-                }
-                
-            except Exception as e:
-                self.logger.error(f"Error extracting content from {url}: {e}")
-                return None
+        self.logger.info(f"✅ Extracted {len(extracted_articles)}/{len(urls)} articles")
+        return extracted_articles
+    
+    async def _extract_many(self, urls: List[str], max_workers: int, timeout: float) -> List[Dict]:
+        """
+        Extract URLs on the event loop with at most max_workers in flight
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_url = {executor.submit(extract_single_article, url): url for url in urls}
-            
-            # Process completed tasks
-            for future in as_completed(future_to_url, timeout=30):  # 30 second timeout
-                url = future_to_url[future]
-                try:
-                    result = future.result(timeout=5)  # 5 second timeout per article
-                    if result:
-                        extracted_articles.append(result)
-                        self.logger.info(f"Successfully extracted: {result.get('title', 'Unknown')}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract {url}: {e}")
+        Downloads share the loop's session and only the parsing takes a pool thread,
+        so a batch no longer ties up one blocked thread per URL. Extractions still
+        unfinished after timeout seconds are cancelled and skipped; the results keep
+        the order of urls.
+        """
+        sem = asyncio.Semaphore(max(1, max_workers))
         
+        async def extract_one(url: str) -> Optional[Dict]:
+            async with sem:
+                return await self.extract_article_content_async(url)
+        
+        tasks = [asyncio.create_task(extract_one(url)) for url in urls]
+        if not tasks:
+            return []
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            self.logger.warning(f"Batch extraction timed out; skipping {len(pending)} unfinished articles")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        extracted_articles = []
+        for url, task in zip(urls, tasks):
+            if task not in done:
+                continue
+            if task.exception() is not None:
+                self.logger.warning(f"Failed to extract {url}: {task.exception()}")
+            elif task.result():
+                extracted_articles.append(task.result())
+                self.logger.debug("Successfully extracted: %s", task.result().get('title', 'Unknown'))
         return extracted_articles
     
     def _extract_articles_sequential(self, urls: List[str]) -> List[Dict]:
@@ -423,15 +925,16 @@ class NewsCollector:
         extracted_articles = []
         
         for i, url in enumerate(urls, 1):
-            self.logger.info(f"Sequentially extracting article {i}/{len(urls)}: {url}")
+            self.logger.debug("Sequentially extracting article %d/%d: %s", i, len(urls), url)
             try:
                 result = self.extract_article_content(url)
                 if result:
                     extracted_articles.append(result)
-                    self.logger.info(f"Successfully extracted: {result.get('title', 'Unknown')}")
+                    self.logger.debug("Successfully extracted: %s", result.get('title', 'Unknown'))
             except Exception as e:
                 self.logger.warning(f"Failed to extract {url}: {e}")
         
+        self.logger.info(f"✅ Extracted {len(extracted_articles)}/{len(urls)} articles")
         return extracted_articles
 
     async def extract_article_content_async(self, url: str) -> Optional[Dict]:
@@ -444,85 +947,247 @@ class NewsCollector:
         Returns:
             Dictionary containing extracted article data or None if failed
         """
-        # Since newspaper3k doesn't support async, we'll use a thread pool
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, self.extract_article_content, url)
+        # Concurrent requests for the same URL share one extraction
+        return await self._single_flight(
+            self._inflight_extract, url,
+            lambda: self._extract_article_content_aio(url)
+        )
+    
+    async def _extract_article_content_aio(self, url: str) -> Optional[Dict]:
+        """Download through the shared aiohttp session and parse on the thread pool"""
+        loop = asyncio.get_running_loop()
+        key = self._extract_cache_key(url)
+        # Memory hits are answered right here; disk reads and their parsing go to the thread
+        # pool so they don't stall the event loop while other downloads are in flight
+        with self._extract_cache_lock:
+            in_memory = key in self._extract_cache
+        if in_memory:
+            cached = self._get_cached_extract(key, url)
+        else:
+            cached = await loop.run_in_executor(self._extractor_pool, self._get_cached_extract, key, url)
+        if cached is not None:
+            return cached
+        
+        # Skip blocked domains to avoid wasting time
+        if self._is_blocked_domain(url):
+            self.logger.debug("Skipping blocked domain: %s", url)
+            return None
+        
+        self.logger.debug("Extracting content from: %s", url)
+        extract = _extract_with_trafilatura if TRAFILATURA_AVAILABLE else _extract_with_newspaper
+        process_pool = _get_parse_process_pool(self.config.PARSE_PROCESSES)
+        
+        async def download_and_parse():
+            html = await self._fetch_html(url)
+            # Only the CPU-bound parse goes to a pool; the download stays on the event loop.
+            # Worker processes, when configured, parse in parallel without sharing the GIL
+            if process_pool is not None:
+                try:
+                    return self._checked_extraction(url, await loop.run_in_executor(process_pool, extract, url, html))
+                except BrokenProcessPool:
+                    self.logger.warning("⚠️ Parse worker process died; restarting the parse pool")
+                    _discard_parse_process_pool(process_pool)
+            return self._checked_extraction(url, await loop.run_in_executor(self._extractor_pool, extract, url, html))
+        
+        timeout = self.config.EXTRACT_TIMEOUT or 15
+        try:
+            # One deadline for the whole extraction, so a slow host or page can't hold up the batch
+            result = await asyncio.wait_for(download_and_parse(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"⏱️ Extraction timed out after {timeout}s: {url}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error extracting content from {url}: {e}")
+            return None
+        
+        if result:
+            await loop.run_in_executor(self._extractor_pool, self._store_cached_extract, key, result)
+            return dict(result)
+        return result
+    
+    async def _fetch_html(self, url: str) -> bytes:
+        """
+        Download a page through the shared aiohttp session, rejecting non-HTML responses
+        
+        Timeouts, connection errors and retryable statuses (429/5xx) get one more try;
+        other 4xx responses fail straight away since retrying them cannot help.
+        """
+        import aiohttp
+        
+        host = self._get_domain(url)
+        for attempt in range(2):
+            try:
+                return await self._fetch_html_once(url, host)
+            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt or (isinstance(e, aiohttp.ClientResponseError) and e.status not in RETRYABLE_STATUS_CODES):
+                    raise
+                retry_after = getattr(e, 'headers', None) and e.headers.get('Retry-After', '')
+                if retry_after and retry_after.strip().isdigit():
+                    # The host pause is waited out before the next request to this site
+                    self._host_delay[host] = min(max(self._host_delay.get(host, 0.0), float(retry_after)),
+                                                 self.config.HOST_BACKOFF_MAX)
+                else:
+                    await asyncio.sleep(0.25)
+                self.logger.debug("Retrying %s after %r", url, e)
     
-    async def collect_articles_async(self, query: str = None, num_articles: int = None) -> List[Dict]:
+    async def _fetch_html_once(self, url: str, host: str) -> bytes:
+        """Make one download attempt under the per-site slot, pause and rate limit"""
+        import aiohttp
+        
+        session = await self._get_session()
+        # Few requests at a time per site, and a growing pause for sites that throttle,
+        # so parallel extractions don't get the whole batch rate-limited
+        async with self._get_host_semaphore(host):
+            delay = self._host_delay.get(host)
+            if delay:
+                await asyncio.sleep(delay)
+            async with self._rate_limit('fetch', self.config.FETCH_RPS):
+                timeout = aiohttp.ClientTimeout(total=ARTICLE_FETCH_TIMEOUT, sock_connect=3)
+                async with session.get(url, timeout=timeout) as response:
+                    self._update_host_delay(host, response.status in (429, 503))
+                    response.raise_for_status()
+                    # Check the headers before reading, so large non-article bodies are never downloaded or parsed
+                    if 'Content-Type' in response.headers and response.content_type not in HTML_CONTENT_TYPES:
+                        raise ValueError(f"Not an HTML page ({response.content_type})")
+                    max_bytes = self.config.MAX_HTML_BYTES
+                    if not max_bytes:
+                        return await response.read()
+                    if (response.content_length or 0) > max_bytes:
+                        raise ValueError(f"Page too large ({response.content_length} bytes)")
+                    # Content-Length can be missing or describe the compressed body, so cap the read too
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        body += chunk
+                        if len(body) > max_bytes:
+                            raise ValueError(f"Page too large (over {max_bytes} bytes)")
+                    return bytes(body)
+    
+    async def collect_articles_async(self, query: str = None, num_articles: int = None,
+                                     progress_callback: Optional[Callable[[int, int], None]] = None,
+                                     article_callback: Optional[Callable[[Dict], Awaitable[None]]] = None) -> List[Dict]:
         """
         Fast collection: Request exactly N articles, filter blocked domains, extract content
         
         Args:
             query: Search query
             num_articles: Number of articles to process (N)
+            progress_callback: Optional callable receiving (articles finished, total) as extractions complete;
+                called on the thread running this coroutine
+            article_callback: Optional coroutine function awaited with each article as soon as it is
+                extracted, e.g. the writer from open_articles_jsonl
             
         Returns:
             List of dictionaries containing article data
         """
+        extracted = []
+        async with contextlib.aclosing(self._iter_extracted_articles(query, num_articles, progress_callback)) as items:
+            async for i, article in items:
+                if article_callback:
+                    await article_callback(article)
+                extracted.append((i, article))
+        
+        # Keep SerpAPI's relevance order
+        extracted.sort(key=lambda item: item[0])
+        final_articles = [article for _, article in extracted]
+        
+        self.logger.info(f"✅ Successfully processed {len(final_articles)} articles")
+        return final_articles
+    
+    async def iter_articles_async(self, query: str = None, num_articles: int = None) -> AsyncIterator[Dict]:
+        """
+        Collect articles like collect_articles_async, yielding each one as soon as it is extracted
+        
+        Args:
+            query: Search query
+            num_articles: Number of articles to process (N)
+            
+        Yields:
+            Article dictionaries in completion order rather than search order
+        """
+        async with contextlib.aclosing(self._iter_extracted_articles(query, num_articles)) as items:
+            async for _, article in items:
+                yield article
+    
+    async def _iter_extracted_articles(self, query: str = None, num_articles: int = None,
+                                       progress_callback: Optional[Callable[[int, int], None]] = None
+                                       ) -> AsyncIterator[Tuple[int, Dict]]:
+        """Search, filter and extract articles, yielding (search position, article) as extractions finish"""
         # N = exact number of articles requested
         N = num_articles or self.config.NUM_ARTICLES
         
-        self.logger.info(f"🚀 Fast Collection Strategy:")
-        self.logger.info(f"   Requesting exactly {N} articles from SerpAPI")
+        self.logger.info(f"🚀 Fast Collection Strategy: requesting {N} articles from SerpAPI")
         
         # Search for news articles - request exactly N
-        articles = self._search_news_sync({
-            'q': query or self.config.SEARCH_QUERY,
-            'api_key': Config.get_serpapi_key(),
-            'engine': 'google_news',
-            'num': N,  # Request exactly N articles
-            'tbm': 'nws'
-        })
+        articles = await self.search_news_async(query, N)
         
         if not articles:
             self.logger.error("No articles found from search")
-            return []
+            return
         
         self.logger.info(f"✅ SerpAPI returned {len(articles)} articles")
         
-        # FORCE LIMITING: SerpAPI often ignores num parameter, so we limit manually
-        if len(articles) > N:
-            self.logger.info(f"🔧 SerpAPI ignored num parameter - limiting from {len(articles)} to {N}")
-            articles = articles[:N]  # Take first N articles (most relevant)
-        
-        # Filter out blocked domains and take available articles
+        # Take the first N usable results (most relevant first). google_news ignores num and
+        # returns its full result list, so results beyond N stand in for blocked or repeated ones
         filtered_articles = []
         blocked_count = 0
+        duplicate_count = 0
+        seen_urls = set()
         
         for article in articles:
+            if len(filtered_articles) == N:
+                break
             url = article.get('link')
-            if url and not self._is_blocked_domain(url):
-                filtered_articles.append(article)
-            else:
+            if not url or self._is_blocked_domain(url):
                 blocked_count += 1
+                continue
+            canonical = self._canonical_url(url)
+            if canonical in seen_urls:
+                duplicate_count += 1
+                continue
+            seen_urls.add(canonical)
+            filtered_articles.append(article)
         
-        self.logger.info(f"🔍 Filtering Results:")
-        self.logger.info(f"   Blocked domains skipped: {blocked_count}")
-        self.logger.info(f"   Available articles: {len(filtered_articles)}")
+        self.logger.info(f"🔍 Filtering Results: {len(filtered_articles)} available, "
+                         f"{blocked_count} blocked and {duplicate_count} duplicate URLs skipped")
         
         if not filtered_articles:
             self.logger.warning("All articles were from blocked domains")
-            return []
-        
-        # Extract URLs for content extraction
-        urls = [article.get('link') for article in filtered_articles]
+            return
         
-        self.logger.info(f"⚡ Extracting content from {len(urls)} articles...")
+        self.logger.info(f"⚡ Extracting content from {len(filtered_articles)} articles...")
         
-        # Extract articles concurrently with reduced workers for speed
-        extracted_articles = self.extract_articles_concurrent(urls, max_workers=10)
+        # Extract articles concurrently; _process_article bounds the number in flight
+        # and combines search metadata with extracted content
+        total = len(filtered_articles)
         
-        # Combine search metadata with extracted content
-        final_articles = []
-        for extracted in extracted_articles:
-            # Find matching article metadata
-            matching_article = next((a for a in filtered_articles if a.get('link') == extracted['url']), {})
-            full_article = {**matching_article, **extracted}
-            final_articles.append(full_article)
+        async def process_indexed(i: int, article: Dict):
+            # An unexpected error loses this article only, not the rest of the batch
+            try:
+                return i, await self._process_article(article, i, total)
+            except Exception as e:
+                self.logger.error(f"Error processing article {i}/{total} ({article.get('link')}): {e}")
+                return i, None
         
-        self.logger.info(f"✅ Successfully processed {len(final_articles)} articles")
-        return final_articles
+        tasks = [
+            asyncio.create_task(process_indexed(i, article))
+            for i, article in enumerate(filtered_articles, 1)
+        ]
+        # Hand results over as they finish so failed extractions are dropped right away.
+        # If the consumer stops early or the collection is cancelled, the remaining tasks are
+        # cancelled and awaited (what a TaskGroup would do, but a TaskGroup can't span the
+        # yields of an async generator). _single_flight then cancels each shared extraction
+        # that no other caller is waiting on, so abandoned downloads and parses stop too
+        try:
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                i, result = await next_result
+                if progress_callback:
+                    progress_callback(done, total)
+                if result:
+                    yield i, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
     async def _process_article(self, article: Dict, index: int, total: int) -> Optional[Dict]:
         """
@@ -536,14 +1201,16 @@ class NewsCollector:
         Returns:
             Processed article or None if failed
         """
-        self.logger.info(f"Processing article {index}/{total}")
+        self.logger.debug("Processing article %d/%d", index, total)
         
         url = article.get('link')
         if not url:
             return None
-            
-        # Extract content from the article
-        extracted_content = await self.extract_article_content_async(url)
+        
+        # Extract content from the article, limiting concurrent extractions
+        async with self._get_extract_semaphore():
+            extracted_content = await self.extract_article_content_async(url)
+        self._record_extraction_result(url, bool(extracted_content))
         
         if extracted_content:
             # Combine search metadata with extracted content
@@ -551,92 +1218,155 @@ class NewsCollector:
                 **article,
                 **extracted_content
             }
-            self.logger.info(f"Successfully extracted article: {full_article.get('title', 'Unknown')}")
+            self.logger.debug("Successfully extracted article: %s", full_article.get('title', 'Unknown'))
             return full_article
         else:
             self.logger.warning(f"Failed to extract content from article {index}")
             return None
     
-    def collect_articles(self, query: str = None, num_articles: int = None) -> List[Dict]:
+    def collect_articles(self, query: str = None, num_articles: int = None,
+                         progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
         """
         Synchronous wrapper for collect_articles_async
         
         Args:
             query: Search query
             num_articles: Number of articles to process
+            progress_callback: Optional callable receiving (articles finished, total);
+                called on the collector's background loop thread
             
         Returns:
             List of dictionaries containing article data
         """
-        # Check if there's already an event loop running
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're in an async context, we need to run this differently
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(self._run_collect_sync, query, num_articles)
-                return future.result()
-        except RuntimeError:
-            # No event loop running, we can create one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.collect_articles_async(query, num_articles))
-            finally:
-                loop.close()
-    
-    def _run_collect_sync(self, query: str = None, num_articles: int = None) -> List[Dict]:
-        """Helper method to run collection in a separate thread"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(self.collect_articles_async(query, num_articles))
-        finally:
-            loop.close()
+        return self._run_sync(lambda: self.collect_articles_async(query, num_articles, progress_callback))
+    
+    def _article_output_path(self, filename: str = None, extension: str = "json") -> str:
+        """Build the output path for a saved article batch"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"finance_news_{timestamp}.{extension}"
+        
+        return os.path.join(self.config.OUTPUT_DIR, filename)
     
-    def save_articles(self, articles: List[Dict], filename: str = None) -> str:
+    @staticmethod
+    def _serialize_articles(articles: List[Dict], pretty: bool = False) -> bytes:
+        """Serialize articles to compact JSON, or indented JSON when pretty is set"""
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(articles, default=str, option=option)
+    
+    @staticmethod
+    def _serialize_article_line(article: Dict) -> bytes:
+        """Serialize one article as a JSON Lines record"""
+        return orjson.dumps(article, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    
+    def save_articles(self, articles: List[Dict], filename: str = None, pretty: bool = False) -> str:
         """
         Save extracted articles to a file
         
         Args:
             articles: List of article dictionaries
             filename: Output filename (optional)
+            pretty: Indent the JSON for reading by hand (optional)
             
         Returns:
             Path to saved file
         """
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"finance_news_{timestamp}.json"
+        filepath = self._article_output_path(filename)
+        
+        try:
+            data = self._serialize_articles(articles, pretty)
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            
+            self.logger.info(f"Saved {len(articles)} articles to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            self.logger.error(f"Error saving articles: {e}")
+            raise
+            
+    def save_articles_jsonl(self, articles: Iterable[Dict], filename: str = None) -> str:
+        """
+        Save extracted articles as JSON Lines, one article per line
         
-        # Ensure output directory exists
-        os.makedirs(self.config.OUTPUT_DIR, exist_ok=True)
+        Each article is serialized and written on its own, so a generator of articles
+        is never held in memory as a whole, and readers can process the file line by line.
         
-        filepath = os.path.join(self.config.OUTPUT_DIR, filename)
+        Args:
+            articles: Iterable of article dictionaries
+            filename: Output filename (optional)
+            
+        Returns:
+            Path to saved file
+        """
+        filepath = self._article_output_path(filename, extension="jsonl")
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, indent=2, ensure_ascii=False, default=str)
+            count = 0
+            with open(filepath, 'wb') as f:
+                for article in articles:
+                    f.write(self._serialize_article_line(article))
+                    count += 1
             
-            self.logger.info(f"Saved {len(articles)} articles to {filepath}")
+            self.logger.info(f"Saved {count} articles to {filepath}")
             return filepath
             
         except Exception as e:
             self.logger.error(f"Error saving articles: {e}")
             raise
+    
+    @contextlib.asynccontextmanager
+    async def open_articles_jsonl(self, filename: str = None) -> AsyncIterator[Callable[[Dict], Awaitable[None]]]:
+        """
+        Open a JSON Lines file for articles that are written while a collection is still running
+        
+        Pass the yielded writer as collect_articles_async's article_callback: each article is
+        written when its extraction finishes, and the file is opened once for any number of
+        collections.
+        
+        Args:
+            filename: Output filename (optional)
             
-    async def save_articles_async(self, articles: List[Dict], filename: str = None) -> str:
+        Yields:
+            Coroutine function appending one article to the file
+        """
+        filepath = self._article_output_path(filename, extension="jsonl")
+        count = 0
+        
+        async with aiofiles.open(filepath, 'wb') as f:
+            async def write_article(article: Dict) -> None:
+                nonlocal count
+                await f.write(self._serialize_article_line(article))
+                count += 1
+            
+            yield write_article
+        
+        self.logger.info(f"Saved {count} articles to {filepath}")
+    
+    async def save_articles_async(self, articles: List[Dict], filename: str = None, pretty: bool = False) -> str:
         """
         Asynchronously save extracted articles to a file
         
         Args:
             articles: List of article dictionaries
             filename: Output filename (optional)
+            pretty: Indent the JSON for reading by hand (optional)
             
         Returns:
             Path to saved file
         """
-        # Since file operations are blocking, we'll use a thread pool
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, self.save_articles, articles, filename)
+        filepath = self._article_output_path(filename)
+        
+        try:
+            data = self._serialize_articles(articles, pretty)
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(data)
+            
+            self.logger.info(f"Saved {len(articles)} articles to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            self.logger.error(f"Error saving articles: {e}")
+            raise
@@ -4,15 +4,216 @@ Enables conversational AI that can query and analyze stored articles
 """
 
 import logging
-import json
+import functools
+import re
+import orjson
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from openai import OpenAI
 from risk_monitor.utils.pinecone_db import PineconeDB
 from risk_monitor.config.settings import Config
 
+# Optional exact token counting for context budgeting (falls back to ~4 chars per token)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Sentences mentioning any of these are kept as key points when an article is summarized
+# (one case-insensitive scan per sentence instead of a lowercase copy and a scan per keyword)
+KEY_POINT_RE = re.compile('|'.join(map(re.escape, [
+    'earnings', 'revenue', 'profit', 'loss', 'growth', 'decline', 'announce', 'launch', 'partnership'
+])), re.IGNORECASE)
+# The same keywords for searching already-lowercased text, several times faster than IGNORECASE
+_KEY_POINT_LOWER_RE = re.compile(KEY_POINT_RE.pattern)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """Load the tiktoken encoding for a chat model once, or None if it can't be loaded"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Model newer than the installed tiktoken
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # The encoding is downloaded on first use, which fails without network access
+        logger.warning(f"Could not load tiktoken encoding, estimating tokens from length: {e}")
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count the chat model's tokens in text"""
+    encoding = _get_encoding(Config.RAG_CHAT_MODEL)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _article_token_count(article: Dict) -> int:
+    """Count an article's text tokens once, kept on the article for follow-up queries over the same results"""
+    token_count = article.get('_token_count')
+    if token_count is None:
+        token_count = _count_tokens(article.get('text', ''))
+        article['_token_count'] = token_count
+    return token_count
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse a stored ISO analysis_timestamp, or datetime.min if it isn't one (memoized, every query re-parses the same articles)"""
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError as e:
+        logger.debug(f"Could not parse analysis_timestamp: {e}")
+        return datetime.min
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_string(date_str: str) -> datetime:
+    """Parse a date in one of the known formats, or datetime.min if none match (memoized, dates repeat across articles)"""
+    for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%dT%H:%M:%S"]:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return datetime.min
+
+
+def _get_date_source(article: Dict) -> str:
+    """Get the source of the date used for filtering"""
+    if article.get('analysis_timestamp', ''):
+        return "Database Storage Date (analysis_timestamp)"
+    return "No Date Available"
+
+
+def _format_article_context(i: int, article: Dict) -> str:
+    """Format one article as a numbered context reference with its complete metadata (uses no service state)"""
+    # Extract ALL available metadata fields
+    title = article.get('title', 'Unknown Title')
+    source_info = article.get('source', {})
+    source_name = source_info.get('name', 'Unknown Source') if isinstance(source_info, dict) else str(source_info)
+    url = article.get('url', '')
+    link = article.get('link', '')
+    publish_date = article.get('publish_date', 'Unknown Date')
+    date = article.get('date', '')
+    authors = article.get('authors', [])
+    summary = article.get('summary', '')
+    keywords = article.get('keywords', [])
+    meta_description = article.get('meta_description', '')
+    text = article.get('text', 'No text available')
+    entity = article.get('entity', '')
+    matched_keywords = article.get('matched_keywords', [])
+    extraction_time = article.get('extraction_time', '')
+    
+    # Sentiment analysis data - check multiple possible fields
+    sentiment_analysis = article.get('sentiment_analysis', {})
+    
+    # Try multiple possible sentiment score fields with priority order
+    sentiment_score = 0
+    if isinstance(sentiment_analysis, dict):
+        sentiment_score = sentiment_analysis.get('score', 0)
+    
+    # If not found in sentiment_analysis, check direct article fields
+    if sentiment_score == 0:
+        sentiment_score = article.get('sentiment_score', 0)
+    
+    # If still not found, check other possible fields
+    if sentiment_score == 0:
+        sentiment_score = article.get('score', 0)
+    
+    # If still not found, check for any numeric sentiment field
+    if sentiment_score == 0:
+        for key, value in article.items():
+            if 'sentiment' in key.lower() and isinstance(value, (int, float)) and value != 0:
+                sentiment_score = value
+                break
+    
+    sentiment_category = sentiment_analysis.get('category', article.get('sentiment_category', 'Unknown')) if isinstance(sentiment_analysis, dict) else article.get('sentiment_category', 'Unknown')
+    sentiment_justification = sentiment_analysis.get('justification', '') if isinstance(sentiment_analysis, dict) else ''
+    
+    # Risk analysis data - check multiple possible fields
+    risk_analysis = article.get('risk_analysis', {})
+    
+    # Try multiple possible risk score fields with priority order
+    risk_score = 0
+    if isinstance(risk_analysis, dict):
+        risk_score = risk_analysis.get('risk_score', 0)
+    
+    # If not found in risk_analysis, check direct article fields
+    if risk_score == 0:
+        risk_score = article.get('risk_score', 0)
+    
+    # If still not found, check other possible fields
+    if risk_score == 0:
+        risk_score = article.get('score', 0)
+    
+    # If still not found, check for any numeric risk field
+    if risk_score == 0:
+        for key, value in article.items():
+            if 'risk' in key.lower() and isinstance(value, (int, float)) and value != 0:
+                risk_score = value
+                break
+    
+    risk_categories = risk_analysis.get('risk_categories', {}) if isinstance(risk_analysis, dict) else {}
+    risk_indicators = risk_analysis.get('risk_indicators', []) if isinstance(risk_analysis, dict) else []
+    
+    # Serialized once per article; follow-up questions over the same cached results reuse it
+    risk_categories_json = 'None'
+    if risk_categories:
+        risk_categories_json = article.get('_risk_categories_json')
+        if risk_categories_json is None:
+            risk_categories_json = orjson.dumps(
+                risk_categories, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+            article['_risk_categories_json'] = risk_categories_json
+    
+    # Include COMPLETE article data
+    return f"""
+### [REFERENCE {i}] - {title}
+
+**COMPLETE ARTICLE METADATA:**
+- Title: {title}
+- Source: {source_name}
+- URL: {url}
+- Link: {link}
+- Published Date: {publish_date}
+- Date: {date}
+- Date Source: {_get_date_source(article)}
+- Authors: {', '.join(authors) if authors else 'Unknown'}
+- Entity: {entity}
+- Extraction Time: {extraction_time}
+- Meta Description: {meta_description}
+
+**CONTENT DATA:**
+- Summary: {summary if summary else 'No summary available'}
+- Keywords: {', '.join(keywords) if keywords else 'No keywords'}
+- Matched Keywords: {', '.join(matched_keywords) if matched_keywords else 'None'}
+
+**SENTIMENT ANALYSIS:**
+- Category: {sentiment_category}
+- Score: {sentiment_score}
+- Justification: {sentiment_justification}
+
+**RISK ANALYSIS:**
+- Risk Score: {risk_score}
+- Risk Categories: {risk_categories_json}
+- Risk Indicators: {', '.join(risk_indicators) if risk_indicators else 'None'}
+
+**FULL ARTICLE TEXT:**
+{text}
+
+---
+"""
+
+
 class RAGService:
     """RAG service for conversational AI with Pinecone database"""
     
@@ -319,35 +520,26 @@ class RAGService:
     
     def search_articles(self, query: str, top_k: int = 50, entity_filter: str = None, date_filter: str = None) -> List[Dict]:
         """Search for articles using OPTIMIZED FILTERING FLOW: Date → Entity → Query"""
-        print(f"🔍 OPTIMIZED SEARCH FLOW - INPUT:")
-        print(f"   Query: '{query}'")
-        print(f"   Top_k: {top_k}")
-        print(f"   Entity Filter: {entity_filter}")
-        print(f"   Date Filter: {date_filter}")
-        print("=" * 80)
+        logger.debug("🔍 Search input: query=%r, top_k=%s, entity_filter=%s, date_filter=%s",
+                     query, top_k, entity_filter, date_filter)
         
         try:
             # Get total number of articles in database
             stats = self.pinecone_db.get_index_stats()
             total_articles = stats.get('total_vector_count', 0)
-            print(f"📊 Database Stats: {total_articles} total articles")
-            
-            # OPTIMIZED FLOW: Apply filters at database level first
-            print(f"🔄 OPTIMIZED FLOW: Date → Entity → Query → Top {top_k}")
+            logger.debug("📊 Database Stats: %s total articles", total_articles)
             
             # Step 1: Get articles with date filter applied at database level
-            print(f"📋 Step 1: Getting articles with DATE FILTER applied at database level...")
             if date_filter and date_filter != "All Dates":
                 filtered_results = self.pinecone_db.get_articles_with_date_filter(date_filter, top_k=total_articles)
-                print(f"✅ Retrieved {len(filtered_results)} articles after date filter")
+                logger.debug("Step 1: Retrieved %d articles after date filter", len(filtered_results))
             else:
                 # No date filter, get all articles
                 filtered_results = self.pinecone_db.get_all_articles(top_k=total_articles)
-                print(f"✅ Retrieved {len(filtered_results)} articles (no date filter)")
+                logger.debug("Step 1: Retrieved %d articles (no date filter)", len(filtered_results))
             
             # Step 2: Apply ENTITY FILTER SECOND (in memory since entity field may not be populated)
             if entity_filter and entity_filter != "All Companies":
-                print(f"🔍 Step 2: Applying ENTITY FILTER SECOND - '{entity_filter}'")
                 original_count = len(filtered_results)
                 
                 # More flexible entity filtering - search in title, text, and entity field
@@ -365,92 +557,55 @@ class RAGService:
                         entity_filtered_results.append(article)
                 
                 filtered_results = entity_filtered_results
-                print(f"   ✅ Entity filter result: {len(filtered_results)} articles (from {original_count})")
-            else:
-                print(f"🔍 Step 2: No entity filter applied")
+                logger.debug("Step 2: Entity filter %r kept %d of %d articles", entity_filter, len(filtered_results), original_count)
             
             # Step 3: Apply USER QUERY FILTER (semantic search on filtered results)
             if query and query.strip():
-                print(f"🔍 Step 3: Applying SEMANTIC SEARCH - '{query}'")
-                print(f"   ⚡ OPTIMIZATION: Getting top {top_k} most relevant articles only")
                 original_count = len(filtered_results)
                 
                 # Perform semantic search on the already filtered results using pre-computed embeddings
                 if filtered_results:
                     # Use the optimized semantic search method that uses pre-computed embeddings
                     filtered_results = self._semantic_search_on_articles(filtered_results, query, top_k)
-                    
-                    print(f"   ✅ Query filter result: {len(filtered_results)} articles (from {original_count})")
+                    logger.debug("Step 3: Semantic search kept top %d of %d articles", len(filtered_results), original_count)
                 else:
-                    print(f"   ⚠️  No articles to apply query filter to")
-            else:
-                print(f"🔍 Step 3: No query filter applied")
-            
-            print(f"📋 FILTERING STATUS:")
-            print(f"   Date filter: {'Applied' if date_filter and date_filter != 'All Dates' else 'None'}")
-            print(f"   Entity filter: {'Applied' if entity_filter and entity_filter != 'All Companies' else 'None'}")
-            print(f"   Query filter: {'Applied' if query and query.strip() else 'None'}")
-            print(f"   Final filtered results: {len(filtered_results)} articles")
+                    logger.debug("Step 3: No articles to apply query filter to")
             
-            # Log comprehensive search results
-            print(f"📊 FINAL SEARCH RESULTS:")
-            print(f"   Total articles found: {len(filtered_results)}")
-            print(f"   Searched: {len(filtered_results)} articles from {total_articles} total")
             logger.info(f"Optimized filtering flow completed: Found {len(filtered_results)} relevant articles for query: '{query}' (searched {len(filtered_results)} articles from {total_articles} total)")
             
             # If we have results, log some statistics for debugging
             if filtered_results:
-                sentiment_distribution = {}
-                for article in filtered_results:
-                    sentiment = article.get('sentiment_category', 'Unknown')
-                    sentiment_distribution[sentiment] = sentiment_distribution.get(sentiment, 0) + 1
-                
-                print(f"📊 Sentiment distribution: {sentiment_distribution}")
+                sentiment_distribution = dict(Counter(article.get('sentiment_category', 'Unknown') for article in filtered_results))
                 logger.info(f"Sentiment distribution in results: {sentiment_distribution}")
                 
-                # DEBUG: Show detailed info about filtered results
-                print(f"\n📋 FILTERED RESULTS DETAILS:")
-                for i, article in enumerate(filtered_results[:5], 1):  # Show first 5
-                    print(f"   Article {i}:")
-                    print(f"      Title: {article.get('title', 'Unknown')[:60]}...")
-                    print(f"      Text length: {len(article.get('text', ''))} chars")
-                    print(f"      Sentiment: {article.get('sentiment_category', 'Unknown')} (score: {article.get('sentiment_score', 0)})")
-                    print(f"      Risk Score: {article.get('risk_score', 0)}")
-                    print(f"      Entity: {article.get('entity', 'None')}")
-                    print(f"      Analysis Timestamp: {article.get('analysis_timestamp', 'None')}")
-                    print()
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, article in enumerate(filtered_results[:5], 1):  # Show first 5
+                        logger.debug(
+                            "   Article %d: %s... | text %d chars | sentiment %s (score: %s) | risk %s | entity %s | analyzed %s",
+                            i, article.get('title', 'Unknown')[:60], len(article.get('text', '')),
+                            article.get('sentiment_category', 'Unknown'), article.get('sentiment_score', 0),
+                            article.get('risk_score', 0), article.get('entity', 'None'),
+                            article.get('analysis_timestamp', 'None')
+                        )
             
-            print(f"✅ NEW FILTERING FLOW - OUTPUT: {len(filtered_results)} articles")
-            print("=" * 80)
             return filtered_results
         except Exception as e:
-            print(f"❌ Error in new filtering flow: {e}")
             logger.error(f"Error in new filtering flow: {e}")
             return []
     
     def _parse_article_date(self, article: Dict) -> datetime:
         """Parse article date using ONLY analysis_timestamp for filtering"""
         # Use ONLY analysis_timestamp from metadata (when stored in database)
-        try:
-            analysis_timestamp = article.get('analysis_timestamp', '')
-            
-            if analysis_timestamp:
-                parsed_date = datetime.fromisoformat(analysis_timestamp.replace('Z', '+00:00'))
-                return parsed_date
-        except Exception as e:
-            logger.debug(f"Could not parse analysis_timestamp: {e}")
+        analysis_timestamp = article.get('analysis_timestamp', '')
+        if analysis_timestamp and isinstance(analysis_timestamp, str):
+            return _parse_timestamp(analysis_timestamp)
         
         # If analysis_timestamp is not available, return minimum date (article will be included in all filters)
         return datetime.min
 
     def _get_date_source(self, article: Dict) -> str:
         """Get the source of the date used for filtering"""
-        analysis_timestamp = article.get('analysis_timestamp', '')
-        
-        if analysis_timestamp:
-            return "Database Storage Date (analysis_timestamp)"
-        
-        return "No Date Available"
+        return _get_date_source(article)
     
     def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
@@ -472,45 +627,45 @@ class RAGService:
             logger.error(f"Error calculating cosine similarity: {e}")
             return 0.0
     
-    def _summarize_articles_for_context(self, articles: List[Dict], max_chars: int) -> List[Dict]:
-        """Summarize articles to fit within context limits"""
-        print(f"   📝 SUMMARIZATION PROCESS:")
-        print(f"      Target max chars: {max_chars}")
-        
+    def _summarize_articles_for_context(self, articles: List[Dict], max_tokens: int) -> List[Dict]:
+        """Summarize articles to fit within the context token budget"""
         summarized_articles = []
         current_total = 0
         
         for i, article in enumerate(articles):
             original_text = article.get('text', '')
             original_length = len(original_text)
+            original_tokens = _article_token_count(article)
             
             # Calculate target length for this article
-            remaining_chars = max_chars - current_total
-            if remaining_chars <= 0:
-                print(f"      ⚠️  Article {i+1}: Skipped (context full)")
+            remaining_tokens = max_tokens - current_total
+            if remaining_tokens <= 0:
+                logger.debug("Article %d: Skipped (context full)", i + 1)
                 break
             
             # If article is too long, summarize it
-            if original_length > remaining_chars:
-                target_length = min(remaining_chars, 2000)  # Cap at 2000 chars per article
-                print(f"      📝 Article {i+1}: Summarizing {original_length} -> {target_length} chars")
+            if original_tokens > remaining_tokens:
+                # Convert the remaining tokens to characters at this article's own chars-per-token rate
+                target_length = min(original_length * remaining_tokens // original_tokens, 2000)  # Cap at 2000 chars per article
+                logger.debug("Article %d: Summarizing %d -> %d chars", i + 1, original_length, target_length)
                 
                 # Create summary by taking first part and key points
                 summary_text = self._create_article_summary(original_text, target_length)
                 article['text'] = summary_text
+                article['_token_count'] = _count_tokens(summary_text)
                 article['_summarized'] = True
             else:
-                print(f"      ✅ Article {i+1}: Using full text ({original_length} chars)")
+                logger.debug("Article %d: Using full text (%d chars)", i + 1, original_length)
                 article['_summarized'] = False
             
             summarized_articles.append(article)
-            current_total += len(article.get('text', ''))
+            current_total += article['_token_count']
             
-            if current_total >= max_chars:
-                print(f"      ⚠️  Context limit reached after {i+1} articles")
+            if current_total >= max_tokens:
+                logger.debug("Context limit reached after %d articles", i + 1)
                 break
         
-        print(f"      📊 Summarization complete: {len(summarized_articles)} articles, {current_total} total chars")
+        logger.debug("📊 Summarization complete: %d articles, %d of %d tokens", len(summarized_articles), current_total, max_tokens)
         return summarized_articles
     
     def _create_article_summary(self, text: str, max_length: int) -> str:
@@ -521,18 +676,34 @@ class RAGService:
         # Take first part and add key points
         first_part = text[:max_length//2]
         
-        # Find key sentences (simple heuristic)
-        sentences = text.split('. ')
+        # Find key sentences (simple heuristic): search the text itself for keywords and copy
+        # out only the sentences that contain them, stopping once there are enough, instead
+        # of splitting a long article into every one of its sentences first
         key_sentences = []
+        key_length = -2  # length of '. '.join(key_sentences)
         
-        # Look for sentences with important keywords
-        important_keywords = ['earnings', 'revenue', 'profit', 'loss', 'growth', 'decline', 'announce', 'launch', 'partnership']
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            key_point_re, haystack = _KEY_POINT_LOWER_RE, lowered
+        else:
+            # Lowercasing expanded some character, so offsets in the copy wouldn't line up with text
+            key_point_re, haystack = KEY_POINT_RE, text
         
-        for sentence in sentences[1:]:  # Skip first sentence (already in first_part)
-            if any(keyword in sentence.lower() for keyword in important_keywords):
-                key_sentences.append(sentence)
-                if len('. '.join(key_sentences)) > max_length//2:
-                    break
+        first_end = text.find('. ')
+        pos = len(text) if first_end == -1 else first_end + 2  # Skip first sentence (already in first_part)
+        while pos < len(text):
+            match = key_point_re.search(haystack, pos)
+            if match is None:
+                break
+            start = text.rfind('. ', pos, match.start())
+            start = pos if start == -1 else start + 2
+            end = text.find('. ', match.end())
+            end = len(text) if end == -1 else end
+            key_sentences.append(text[start:end])
+            key_length += end - start + 2
+            if key_length > max_length//2:
+                break
+            pos = end + 2
         
         summary = first_part + "\n\nKey Points:\n" + '. '.join(key_sentences)
         
@@ -544,83 +715,44 @@ class RAGService:
     
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string to datetime object"""
-        if not date_str or date_str == 'N/A' or date_str == 'Unknown':
-            return datetime.min
-        
-        try:
-            # Try different date formats
-            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%dT%H:%M:%S"]:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            
-            # If all formats fail, return minimum date
-            return datetime.min
-        except Exception:
+        if not date_str or date_str == 'N/A' or date_str == 'Unknown' or not isinstance(date_str, str):
             return datetime.min
+        return _parse_date_string(date_str)
     
     def format_context_for_llm(self, articles: List[Dict]) -> str:
         """Format retrieved articles into context for LLM with COMPLETE article data"""
-        print(f"\n📝 FORMAT CONTEXT FOR LLM - INPUT:")
-        print(f"   Articles count: {len(articles)}")
-        print("=" * 80)
-        
         if not articles:
-            print(f"❌ No articles provided")
+            logger.debug("No articles provided for context")
             return "No relevant articles found."
         
         # STAGE 3: Optional Summarization for Context Management
-        print(f"\n📋 STAGE 3: CONTEXT SIZE MANAGEMENT")
-        max_context_chars = 40000  # Conservative limit to prevent token overflow
-        total_text_length = sum(len(article.get('text', '')) for article in articles)
-        print(f"   Total text length: {total_text_length} characters")
-        print(f"   Context limit: {max_context_chars} characters")
+        max_context_tokens = self.config.RAG_CONTEXT_TOKENS
+        total_text_tokens = sum(_article_token_count(article) for article in articles)
+        logger.debug("📝 Formatting %d articles for context: %d text tokens (limit %d)",
+                     len(articles), total_text_tokens, max_context_tokens)
         
-        if total_text_length > max_context_chars:
-            print(f"   ⚠️  Context size exceeds limit, applying summarization")
-            articles = self._summarize_articles_for_context(articles, max_context_chars)
-            print(f"   ✅ Summarization applied, {len(articles)} articles processed")
-        else:
-            print(f"   ✅ Context size within limits, no summarization needed")
+        if total_text_tokens > max_context_tokens:
+            articles = self._summarize_articles_for_context(articles, max_context_tokens)
         
         # Limit articles to prevent context length exceeded error
         max_articles = 15  # Reduced to accommodate full article data
         if len(articles) > max_articles:
-            print(f"⚠️  Limiting articles from {len(articles)} to {max_articles}")
             logger.info(f"Limiting articles from {len(articles)} to {max_articles} to accommodate complete article data")
             articles = articles[:max_articles]
         
-        print(f"📝 Processing {len(articles)} articles for context...")
-        
-        # DEBUG: Show input articles structure
-        print(f"\n📋 INPUT ARTICLES STRUCTURE:")
-        for i, article in enumerate(articles[:3], 1):  # Show first 3
-            print(f"   Article {i} keys: {list(article.keys())}")
-            print(f"      Title: {article.get('title', 'Unknown')[:50]}...")
-            print(f"      Text length: {len(article.get('text', ''))} chars")
-            print(f"      Has sentiment_analysis: {'sentiment_analysis' in article}")
-            print(f"      Has risk_analysis: {'risk_analysis' in article}")
-            print(f"      Has analysis_timestamp: {'analysis_timestamp' in article}")
-            
-            # Debug sentiment score extraction
-            sentiment_analysis = article.get('sentiment_analysis', {})
-            direct_sentiment_score = article.get('sentiment_score', 'Not found')
-            direct_score = article.get('score', 'Not found')
-            sentiment_score = sentiment_analysis.get('score', 'Not found') if isinstance(sentiment_analysis, dict) else 'Not found'
-            print(f"      Sentiment score fields:")
-            print(f"         sentiment_analysis.score: {sentiment_score}")
-            print(f"         article.sentiment_score: {direct_sentiment_score}")
-            print(f"         article.score: {direct_score}")
-            
-            # Debug risk score extraction
-            risk_analysis = article.get('risk_analysis', {})
-            direct_risk_score = article.get('risk_score', 'Not found')
-            risk_score = risk_analysis.get('risk_score', 'Not found') if isinstance(risk_analysis, dict) else 'Not found'
-            print(f"      Risk score fields:")
-            print(f"         risk_analysis.risk_score: {risk_score}")
-            print(f"         article.risk_score: {direct_risk_score}")
-            print()
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, article in enumerate(articles[:3], 1):  # Show first 3
+                sentiment_analysis = article.get('sentiment_analysis', {})
+                risk_analysis = article.get('risk_analysis', {})
+                logger.debug(
+                    "   Article %d: %s... | text %d chars | keys %s | sentiment_analysis.score=%s "
+                    "sentiment_score=%s score=%s | risk_analysis.risk_score=%s risk_score=%s",
+                    i, article.get('title', 'Unknown')[:50], len(article.get('text', '')), list(article.keys()),
+                    sentiment_analysis.get('score', 'Not found') if isinstance(sentiment_analysis, dict) else 'Not found',
+                    article.get('sentiment_score', 'Not found'), article.get('score', 'Not found'),
+                    risk_analysis.get('risk_score', 'Not found') if isinstance(risk_analysis, dict) else 'Not found',
+                    article.get('risk_score', 'Not found')
+                )
         
         context_parts = []
         
@@ -633,18 +765,9 @@ Query coverage: Complete article data with full metadata
 Analysis scope: Full article content and comprehensive analysis
 """)
         
-        # Group articles by sentiment for better analysis
-        sentiment_groups = {}
-        for article in articles:
-            sentiment = article.get('sentiment_category', 'Unknown')
-            if sentiment not in sentiment_groups:
-                sentiment_groups[sentiment] = []
-            sentiment_groups[sentiment].append(article)
-        
-        # Add sentiment distribution
-        sentiment_summary = []
-        for sentiment, articles_list in sentiment_groups.items():
-            sentiment_summary.append(f"{sentiment}: {len(articles_list)} articles")
+        # Add sentiment distribution (in order of first appearance)
+        sentiment_counts = Counter(article.get('sentiment_category', 'Unknown') for article in articles)
+        sentiment_summary = [f"{sentiment}: {count} articles" for sentiment, count in sentiment_counts.items()]
         
         context_parts.append(f"""
 ## SENTIMENT DISTRIBUTION
@@ -654,114 +777,7 @@ Analysis scope: Full article content and comprehensive analysis
 """)
         
         # Format each article with COMPLETE metadata and full content
-        for i, article in enumerate(articles, 1):
-            # Extract ALL available metadata fields
-            title = article.get('title', 'Unknown Title')
-            source_info = article.get('source', {})
-            source_name = source_info.get('name', 'Unknown Source') if isinstance(source_info, dict) else str(source_info)
-            url = article.get('url', '')
-            link = article.get('link', '')
-            publish_date = article.get('publish_date', 'Unknown Date')
-            date = article.get('date', '')
-            authors = article.get('authors', [])
-            summary = article.get('summary', '')
-            keywords = article.get('keywords', [])
-            meta_description = article.get('meta_description', '')
-            text = article.get('text', 'No text available')
-            entity = article.get('entity', '')
-            matched_keywords = article.get('matched_keywords', [])
-            extraction_time = article.get('extraction_time', '')
-            
-            # Sentiment analysis data - check multiple possible fields
-            sentiment_analysis = article.get('sentiment_analysis', {})
-            
-            # Try multiple possible sentiment score fields with priority order
-            sentiment_score = 0
-            if isinstance(sentiment_analysis, dict):
-                sentiment_score = sentiment_analysis.get('score', 0)
-            
-            # If not found in sentiment_analysis, check direct article fields
-            if sentiment_score == 0:
-                sentiment_score = article.get('sentiment_score', 0)
-            
-            # If still not found, check other possible fields
-            if sentiment_score == 0:
-                sentiment_score = article.get('score', 0)
-            
-            # If still not found, check for any numeric sentiment field
-            if sentiment_score == 0:
-                for key, value in article.items():
-                    if 'sentiment' in key.lower() and isinstance(value, (int, float)) and value != 0:
-                        sentiment_score = value
-                        break
-            
-            sentiment_category = sentiment_analysis.get('category', article.get('sentiment_category', 'Unknown')) if isinstance(sentiment_analysis, dict) else article.get('sentiment_category', 'Unknown')
-            sentiment_justification = sentiment_analysis.get('justification', '') if isinstance(sentiment_analysis, dict) else ''
-            
-            # Risk analysis data - check multiple possible fields
-            risk_analysis = article.get('risk_analysis', {})
-            
-            # Try multiple possible risk score fields with priority order
-            risk_score = 0
-            if isinstance(risk_analysis, dict):
-                risk_score = risk_analysis.get('risk_score', 0)
-            
-            # If not found in risk_analysis, check direct article fields
-            if risk_score == 0:
-                risk_score = article.get('risk_score', 0)
-            
-            # If still not found, check other possible fields
-            if risk_score == 0:
-                risk_score = article.get('score', 0)
-            
-            # If still not found, check for any numeric risk field
-            if risk_score == 0:
-                for key, value in article.items():
-                    if 'risk' in key.lower() and isinstance(value, (int, float)) and value != 0:
-                        risk_score = value
-                        break
-            
-            risk_categories = risk_analysis.get('risk_categories', {}) if isinstance(risk_analysis, dict) else {}
-            risk_indicators = risk_analysis.get('risk_indicators', []) if isinstance(risk_analysis, dict) else []
-            
-            # Include COMPLETE article data
-            article_context = f"""
-### [REFERENCE {i}] - {title}
-
-**COMPLETE ARTICLE METADATA:**
-- Title: {title}
-- Source: {source_name}
-- URL: {url}
-- Link: {link}
-- Published Date: {publish_date}
-- Date: {date}
-- Date Source: {self._get_date_source(article)}
-- Authors: {', '.join(authors) if authors else 'Unknown'}
-- Entity: {entity}
-- Extraction Time: {extraction_time}
-- Meta Description: {meta_description}
-
-**CONTENT DATA:**
-- Summary: {summary if summary else 'No summary available'}
-- Keywords: {', '.join(keywords) if keywords else 'No keywords'}
-- Matched Keywords: {', '.join(matched_keywords) if matched_keywords else 'None'}
-
-**SENTIMENT ANALYSIS:**
-- Category: {sentiment_category}
-- Score: {sentiment_score}
-- Justification: {sentiment_justification}
-
-**RISK ANALYSIS:**
-- Risk Score: {risk_score}
-- Risk Categories: {json.dumps(risk_categories, indent=2) if risk_categories else 'None'}
-- Risk Indicators: {', '.join(risk_indicators) if risk_indicators else 'None'}
-
-**FULL ARTICLE TEXT:**
-{text}
-
----
-"""
-            context_parts.append(article_context)
+        context_parts.extend(_format_article_context(i, article) for i, article in enumerate(articles, 1))
         
         # Add flexible analysis instructions
         context_parts.append(f"""
@@ -783,31 +799,12 @@ Analysis scope: Full article content and comprehensive analysis
 """)
         
         final_context = "\n".join(context_parts)
-        print(f"📝 FORMAT CONTEXT FOR LLM - OUTPUT:")
-        print(f"   Final context length: {len(final_context)} characters")
-        print(f"   Articles processed: {len(articles)}")
-        print(f"   Average article text length: {sum(len(article.get('text', '')) for article in articles) // len(articles) if articles else 0} chars")
-        
-        # Production-level context analysis
-        print(f"\n📋 PRODUCTION CONTEXT ANALYSIS:")
-        print(f"   Total context size: {len(final_context)} characters")
-        print(f"   Estimated tokens: ~{len(final_context) // 4} tokens")
-        print(f"   Context efficiency: {'✅ Optimal' if len(final_context) < 40000 else '⚠️ Large'}")
-        
-        # Show summarization status
-        summarized_count = sum(1 for article in articles if article.get('_summarized', False))
-        if summarized_count > 0:
-            print(f"   Summarized articles: {summarized_count}/{len(articles)}")
-        
-        # DEBUG: Show context structure
-        print(f"\n📋 CONTEXT STRUCTURE BREAKDOWN:")
-        print(f"   Dataset overview: ~{len(context_parts[0])} chars")
-        print(f"   Sentiment distribution: ~{len(context_parts[1])} chars")
-        print(f"   Article data header: ~{len(context_parts[2])} chars")
-        print(f"   Individual articles: ~{sum(len(part) for part in context_parts[3:-1])} chars")
-        print(f"   Analysis instructions: ~{len(context_parts[-1])} chars")
-        
-        print("=" * 80)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Counting the whole context's tokens is only worth it when someone reads the result
+            summarized_count = sum(1 for article in articles if article.get('_summarized', False))
+            logger.debug("📝 Context ready: %d articles (%d summarized), %d chars, %d tokens%s",
+                         len(articles), summarized_count, len(final_context), _count_tokens(final_context),
+                         '' if _get_encoding(self.config.RAG_CHAT_MODEL) else ' (estimated)')
         return final_context
     
     def generate_response(self, user_query: str, articles: List[Dict]) -> Dict[str, Any]:
@@ -1133,7 +1130,7 @@ Remember: You are a trusted financial advisor AI providing data-driven insights
             print()
             
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.config.RAG_CHAT_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
@@ -1278,8 +1275,6 @@ Remember: You are a trusted financial advisor AI providing data-driven insights
                 
                 # Extract company names from title and text
                 # Look for common company patterns
-                import re
-                
                 # Common company name patterns
                 patterns = [
                     r'\b(Apple|AAPL|Microsoft|MSFT|Google|GOOGL|Amazon|AMZN|Tesla|TSLA|Meta|FB|Netflix|NFLX|NVIDIA|NVDA|Intel|INTC|AMD|Advanced Micro Devices|IBM|Oracle|ORCL|Salesforce|CRM|Adobe|ADBE|Cisco|CSCO|Qualcomm|QCOM|PayPal|PYPL|Zoom|ZM|Slack|WORK|Spotify|SPOT|Twitter|TWTR|Uber|UBER|Lyft|LYFT|Airbnb|ABNB|DoorDash|DASH|Palantir|PLTR|Snowflake|SNOW|Datadog|DDOG|CrowdStrike|CRWD|ZoomInfo|ZI|DocuSign|DOCU|Twilio|TWLO|Shopify|SHOP|Square|SQ|Roku|ROKU|Pinterest|PINS|Snap|SNAP|Match|MTCH|Electronic Arts|EA|Take-Two|TTWO|Activision|ATVI|Unity|U|Roblox|RBLX|Palantir|PLTR|Snowflake|SNOW|Datadog|DDOG|CrowdStrike|CRWD|ZoomInfo|ZI|DocuSign|DOCU|Twilio|TWLO|Shopify|SHOP|Square|SQ|Roku|ROKU|Pinterest|PINS|Snap|SNAP|Match|MTCH|Electronic Arts|EA|Take-Two|TTWO|Activision|ATVI|Unity|U|Roblox|RBLX)\b',
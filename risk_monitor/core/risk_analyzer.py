@@ -7,7 +7,9 @@ import re
 import logging
 import os
 import json
+import orjson
 import asyncio
+import threading
 from typing import List, Dict, Tuple, Any
 from collections import Counter
 from datetime import datetime
@@ -27,6 +29,18 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("PineconeDB not available - Pinecone storage will be disabled")
 
+# Shared workers for sync callers that are already inside a running event loop (started on first use)
+_sync_executor = None
+_sync_executor_lock = threading.Lock()
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    """Get the shared executor for running analyses off a thread whose loop is already running"""
+    global _sync_executor
+    with _sync_executor_lock:
+        if _sync_executor is None:
+            _sync_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="risk-sync")
+        return _sync_executor
+
 class RiskAnalyzer:
     """Analyzes news articles for potential risks and market sentiment using advanced LLM analysis"""
     
@@ -639,8 +653,9 @@ Provide a detailed, nuanced risk assessment that considers both immediate and lo
         filepath = os.path.join(self.config.OUTPUT_DIR, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False, default=str)
+            data = orjson.dumps(analysis, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(filepath, 'wb') as f:
+                f.write(data)
             
             self.logger.info(f"Saved advanced risk analysis to {filepath}")
             return filepath
@@ -681,27 +696,25 @@ Provide a detailed, nuanced risk assessment that considers both immediate and lo
         # Use the fallback analysis for text-only input
         return self._fallback_risk_analysis(mock_article)
 
+    def _run_sync(self, make_coro):
+        """
+        Run an analysis coroutine to completion from synchronous code
+        
+        Each call gets its own loop: the LLM calls block inside these coroutines,
+        so sharing one loop would serialize analyses from concurrent sessions.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(make_coro())
+        # A loop can't be nested inside this thread's running loop, so use a shared worker thread's
+        return _get_sync_executor().submit(asyncio.run, make_coro()).result()
+
     # Legacy methods for backward compatibility
     def analyze_articles(self, articles: List[Dict]) -> Dict:
         """Legacy method - now uses advanced LLM analysis"""
         try:
-            # Check if we're already in an event loop
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, use asyncio.create_task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self.analyze_and_store_advanced(articles))
-                    return future.result()
-            except RuntimeError:
-                # No event loop running, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(self.analyze_and_store_advanced(articles))
-                    return result
-                finally:
-                    loop.close()
+            return self._run_sync(lambda: self.analyze_and_store_advanced(articles))
         except Exception as e:
             self.logger.error(f"Error in analyze_articles: {e}")
             import traceback
@@ -727,23 +740,7 @@ Provide a detailed, nuanced risk assessment that considers both immediate and lo
     def analyze_articles_with_sentiment(self, articles: List[Dict], sentiment_method: str = 'llm') -> List[Dict]:
         """Legacy method - now uses advanced LLM analysis"""
         try:
-            # Check if we're already in an event loop
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, use asyncio.create_task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self.analyze_articles_with_advanced_risk(articles, sentiment_method))
-                    return future.result()
-            except RuntimeError:
-                # No event loop running, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(self.analyze_articles_with_advanced_risk(articles, sentiment_method))
-                    return result
-                finally:
-                    loop.close()
+            return self._run_sync(lambda: self.analyze_articles_with_advanced_risk(articles, sentiment_method))
         except Exception as e:
             self.logger.error(f"Error in analyze_articles_with_sentiment: {e}")
             import traceback
@@ -765,42 +762,10 @@ Provide a detailed, nuanced risk assessment that considers both immediate and lo
         try:
             if store_in_db:
                 # Use the advanced method that includes storage in sentiment-db
-                # Check if we're already in an event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                    # We're in an async context, use asyncio.create_task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, self.analyze_and_store_advanced(articles, sentiment_method, selected_entity, search_mode))
-                        return future.result()
-                except RuntimeError:
-                    # No event loop running, create one
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        result = loop.run_until_complete(self.analyze_and_store_advanced(articles, sentiment_method, selected_entity, search_mode))
-                        return result
-                    finally:
-                        loop.close()
+                return self._run_sync(lambda: self.analyze_and_store_advanced(articles, sentiment_method, selected_entity, search_mode))
             else:
                 # Analyze without storing in database
-                # Check if we're already in an event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                    # We're in an async context, use asyncio.create_task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, self.analyze_articles_with_advanced_risk(articles, sentiment_method))
-                        analysis_results = future.result()
-                except RuntimeError:
-                    # No event loop running, create one
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        # Perform analysis without storage
-                        analysis_results = loop.run_until_complete(self.analyze_articles_with_advanced_risk(articles, sentiment_method))
-                    finally:
-                        loop.close()
+                analysis_results = self._run_sync(lambda: self.analyze_articles_with_advanced_risk(articles, sentiment_method))
                 
                 # Create summary without storage stats
                 summary = {
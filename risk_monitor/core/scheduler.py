@@ -9,13 +9,14 @@ import time
 import logging
 import os
 import json
+import orjson
+import aiofiles
 import datetime
 import pytz
 import re
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any
 import argparse
-from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 
 # Load secrets into environment before importing other modules
@@ -201,20 +202,25 @@ class NewsScheduler:
             logger.error(f"Error collecting news for {entity}: {e}")
             return []
             
-    async def collect_entity_news_async(self, entity: str, num_articles: int) -> List[Dict]:
-        """Collect news for a specific entity asynchronously with optimized performance"""
+    async def collect_entity_news_async(self, entity: str, num_articles: int,
+                                        write_article: Optional[Callable[[Dict], Awaitable[None]]] = None) -> List[Dict]:
+        """Collect news for a specific entity asynchronously, passing each article to write_article as it is extracted"""
         logger.info(f"Collecting news for entity: {entity}")
+        
+        async def on_article(article: Dict):
+            # Add entity information before the article is written out
+            article['entity'] = entity
+            if write_article:
+                await write_article(article)
+        
         try:
             # Use the optimized async collection method
             articles = await self.collector.collect_articles_async(
                 query=entity,
-                num_articles=num_articles
+                num_articles=num_articles,
+                article_callback=on_article
             )
             
-            # Add entity information to each article
-            for article in articles:
-                article['entity'] = entity
-            
             logger.info(f"Collected {len(articles)} articles for {entity}")
             return articles
         except Exception as e:
@@ -257,14 +263,13 @@ class NewsScheduler:
         """Analyze sentiment using lexicon-based structured method asynchronously"""
         logger.info(f"Analyzing sentiment for {len(articles)} articles using structured lexicon (async)")
         
-        # Use thread pool for CPU-bound lexicon analysis
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            processed_articles = await loop.run_in_executor(
-                executor,
-                self._analyze_with_lexicon_structured,
-                articles
-            )
+        # Run the lexicon analysis on the loop's shared default executor
+        loop = asyncio.get_running_loop()
+        processed_articles = await loop.run_in_executor(
+            None,
+            self._analyze_with_lexicon_structured,
+            articles
+        )
         
         return processed_articles
     
@@ -359,14 +364,13 @@ class NewsScheduler:
         
         logger.info(f"Storing {len(articles)} articles in Pinecone database")
         
-        # Use thread pool for database operations
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                self._store_articles_batch,
-                articles
-            )
+        # Run the blocking database writes on the loop's shared default executor
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None,
+            self._store_articles_batch,
+            articles
+        )
         
         return result
     
@@ -412,6 +416,7 @@ class NewsScheduler:
         try:
             return loop.run_until_complete(self.run_daily_collection_async())
         finally:
+            loop.run_until_complete(self.collector.aclose())
             loop.close()
             
     async def run_daily_collection_async(self):
@@ -427,18 +432,21 @@ class NewsScheduler:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         all_articles = []
         
-        # Create tasks for collecting news for each entity
-        entity_tasks = []
-        for entity in self.config.entities:
-            task = self.collect_entity_news_async(
-                entity, 
-                self.config.articles_per_entity
-            )
-            entity_tasks.append(task)
-        
-        # Run all entity collection tasks concurrently
-        logger.info(f"Starting concurrent collection for {len(self.config.entities)} entities")
-        entity_results = await asyncio.gather(*entity_tasks)
+        # Every entity's articles are written to one JSON Lines file as their extractions finish
+        async with self.collector.open_articles_jsonl(f"daily_collection_{timestamp}.jsonl") as write_article:
+            # Create tasks for collecting news for each entity
+            entity_tasks = []
+            for entity in self.config.entities:
+                task = self.collect_entity_news_async(
+                    entity, 
+                    self.config.articles_per_entity,
+                    write_article
+                )
+                entity_tasks.append(task)
+            
+            # Run all entity collection tasks concurrently
+            logger.info(f"Starting concurrent collection for {len(self.config.entities)} entities")
+            entity_results = await asyncio.gather(*entity_tasks)
         
         # Combine results
         for entity_articles in entity_results:
@@ -492,8 +500,10 @@ class NewsScheduler:
             'timestamp': timestamp
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(full_data, f, indent=2, default=str)
+        # orjson serializes the whole payload in one pass and emits UTF-8 bytes for a single write
+        data = orjson.dumps(full_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        async with aiofiles.open(output_file, 'wb') as f:
+            await f.write(data)
         
         logger.info(f"Daily collection completed. Results saved to {output_file}")
         
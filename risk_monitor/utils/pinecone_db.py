@@ -9,7 +9,6 @@ import os
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Try to import Pinecone, but handle gracefully if not available
@@ -182,16 +181,15 @@ class PineconeDB:
             # Store in database
             article_id = hashlib.md5(article['url'].encode()).hexdigest()
             
-            # Use ThreadPoolExecutor for synchronous Pinecone operations
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                await loop.run_in_executor(
-                    executor,
-                    lambda: self.index.upsert(
-                        vectors=[(article_id, embedding, metadata)],
-                        namespace="articles"
-                    )
+            # Run the synchronous Pinecone upsert on the loop's shared default executor
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: self.index.upsert(
+                    vectors=[(article_id, embedding, metadata)],
+                    namespace="articles"
                 )
+            )
             
             logger.info(f"Successfully stored article in database: {article.get('title', 'Unknown')}")
             return True
@@ -234,15 +232,14 @@ class PineconeDB:
                 text = text[:8000]
             
             # Generate embedding asynchronously
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                response = await loop.run_in_executor(
-                    executor,
-                    lambda: client.embeddings.create(
-                        model="text-embedding-3-large",
-                        input=text
-                    )
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                None,
+                lambda: client.embeddings.create(
+                    model="text-embedding-3-large",
+                    input=text
                 )
+            )
             
             return response.data[0].embedding
             
@@ -4,8 +4,13 @@ Enhanced for advanced financial risk analysis.
 """
 
 from typing import Dict, List
+import asyncio
+import concurrent.futures
+import functools
 import re
 import json
+import threading
+import weakref
 
 # Enhanced Financial Sentiment Analysis Configuration
 FINANCE_POSITIVE_WORDS = [
@@ -41,6 +46,45 @@ EVENT_TYPES = [
     "inflows_outflows", "ratings", "operations", "donations", "other"
 ]
 
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(openai_api_key: str):
+    """Shared OpenAI client per API key, so requests reuse pooled keep-alive connections"""
+    from openai import OpenAI
+    import httpx
+    return OpenAI(api_key=openai_api_key, http_client=httpx.Client(
+        timeout=httpx.Timeout(30.0),
+        follow_redirects=True
+    ))
+
+# Event loop reused by each thread that runs sentiment coroutines synchronously
+_thread_state = threading.local()
+# Shared workers for sync callers that are already inside a running event loop (started on first use)
+_sync_executor = None
+_sync_executor_lock = threading.Lock()
+
+class _ThreadLoop:
+    """Holds a thread's event loop and closes it once the thread is gone"""
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        # The thread-local state is dropped when its thread exits, which collects this holder
+        weakref.finalize(self, self.loop.close)
+
+def _run_coroutine_sync(coro):
+    """Run a coroutine to completion on this thread's event loop, creating it only once per thread"""
+    holder = getattr(_thread_state, 'holder', None)
+    if holder is None or holder.loop.is_closed():
+        holder = _thread_state.holder = _ThreadLoop()
+    return holder.loop.run_until_complete(coro)
+
+def _get_sync_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared executor for running coroutines off a thread whose loop is already running"""
+    global _sync_executor
+    with _sync_executor_lock:
+        if _sync_executor is None:
+            _sync_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="sentiment-sync")
+        return _sync_executor
+
 async def analyze_sentiment_lexicon(text: str) -> Dict:
     """
     Analyze sentiment using enhanced lexicon-based approach
@@ -109,8 +153,6 @@ async def analyze_sentiment_llm(text: str, openai_api_key: str) -> Dict:
     Analyze sentiment using OpenAI GPT-4o with enhanced financial context
     Returns: {'score': float, 'category': str, 'justification': str, 'confidence': float}
     """
-    from openai import OpenAI
-    
     if not text:
         return {
             'score': 0.0, 
@@ -120,11 +162,7 @@ async def analyze_sentiment_llm(text: str, openai_api_key: str) -> Dict:
         }
     
     try:
-        import httpx
-        client = OpenAI(api_key=openai_api_key, http_client=httpx.Client(
-            timeout=httpx.Timeout(30.0),
-            follow_redirects=True
-        ))
+        client = _get_openai_client(openai_api_key)
         
         system_prompt = """You are an expert financial sentiment analyst specializing in market sentiment analysis, investor psychology, and financial news interpretation. Your role is to analyze financial news articles and provide nuanced sentiment assessments.
 
@@ -238,13 +276,7 @@ async def analyze_sentiment_structured(text: str, title: str = "", openai_api_ke
         return analyze_sentiment_lexicon_structured(text, title)
     
     try:
-        from openai import OpenAI
-        import httpx
-        
-        client = OpenAI(api_key=openai_api_key, http_client=httpx.Client(
-            timeout=httpx.Timeout(30.0),
-            follow_redirects=True
-        ))
+        client = _get_openai_client(openai_api_key)
         
         system_prompt = """You are an intelligent agent that helps track reputation risk for financial entities and provides relevant sentiment scores based on news articles.
 
@@ -544,25 +576,16 @@ def analyze_sentiment_sync(text: str, method: str = 'llm', openai_api_key: str =
     if method == 'lexicon':
         return analyze_sentiment_lexicon(text)
     elif method == 'llm' and openai_api_key:
-        import asyncio
         try:
-            # Check if we're already in an event loop
             try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, use asyncio.create_task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, analyze_sentiment_llm(text, openai_api_key))
-                    return future.result()
+                asyncio.get_running_loop()
             except RuntimeError:
-                # No event loop running, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(analyze_sentiment_llm(text, openai_api_key))
-                    return result
-                finally:
-                    loop.close()
+                # No event loop running in this thread, so reuse its own loop
+                return _run_coroutine_sync(analyze_sentiment_llm(text, openai_api_key))
+            # A loop can't be nested inside this thread's running loop, so use a shared worker thread's
+            return _get_sync_executor().submit(
+                lambda: _run_coroutine_sync(analyze_sentiment_llm(text, openai_api_key))
+            ).result()
         except Exception as e:
             # Fallback to lexicon-based analysis with error logging
             import logging